@@ -13,6 +13,7 @@ one release.
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
@@ -146,7 +147,15 @@ class ASREngine(ABC):
         voice note) that doesn't need to manage stream lifecycle. Creates
         a short-lived stream, runs the full cycle, and returns the final
         transcript.
+
+        The stream methods are synchronous and a batch decode can take
+        seconds, so the cycle runs in a worker thread. This keeps the
+        event loop (and any ``asyncio.wait_for`` timeout around the call)
+        responsive.
         """
+        return await asyncio.to_thread(self._transcribe_blocking, pcm)
+
+    def _transcribe_blocking(self, pcm: np.ndarray) -> str:
         stream = self.create_stream()
         try:
             stream.start()
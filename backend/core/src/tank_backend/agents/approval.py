@@ -8,6 +8,7 @@ In autonomous mode, the resolver auto-approves or auto-denies instead.
 
 from __future__ import annotations
 
+import json
 import logging
 import threading
 import time
@@ -325,8 +326,6 @@ class PendingToolCallStore:
 
 def _build_tool_description(tool_name: str, tool_args: dict[str, Any]) -> str:
     """Build a human-readable description of a tool call."""
-    import json
-
     if tool_name in ("run_command", "persistent_shell") and "command" in tool_args:
         return tool_args["command"]
     if tool_name == "manage_process":
@@ -399,8 +398,6 @@ class ApprovalGateExecutor:
 
     async def execute_openai_tool_call(self, tool_call: Any) -> ToolResult | str:
         """Execute tool, block it, or delegate to resolver."""
-        import json
-
         tool_name = tool_call.function.name
 
         try:
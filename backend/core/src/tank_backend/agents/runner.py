@@ -8,6 +8,7 @@ lifecycle management consistently through this one entry point.
 from __future__ import annotations
 
 import logging
+import re
 import time
 import uuid
 from collections.abc import AsyncIterator
@@ -25,6 +26,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_PATH_RE = re.compile(r"(?:~|/)[^\s,;\"'`\]\)}>]+")
+
 MAX_AGENT_DEPTH = 3
 MAX_CONCURRENT_AGENTS = 5
 
@@ -319,14 +322,11 @@ class AgentRunner:
     @staticmethod
     def _extract_paths_from_messages(messages: list[dict[str, Any]]) -> list[str]:
         """Extract file/directory paths from message content (simple heuristic)."""
-        import re
-
-        path_re = re.compile(r"(?:~|/)[^\s,;\"'`\]\)}>]+")
         paths: list[str] = []
         for msg in messages:
             content = msg.get("content", "")
             if isinstance(content, str):
-                paths.extend(path_re.findall(content))
+                paths.extend(_PATH_RE.findall(content))
         return paths
 
     def _post_bus_event(
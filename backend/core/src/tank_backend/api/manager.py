@@ -186,7 +186,7 @@ class ConnectionManager:
         loop = asyncio.get_running_loop()
         self._idle_timers[session_id] = loop.call_later(
             self.SESSION_IDLE_TIMEOUT,
-            lambda: asyncio.ensure_future(self.close_session(session_id)),
+            lambda: asyncio.ensure_future(self._close_idle_session(session_id)),
         )
         logger.info(
             f"Idle timer started for {session_id} ({self.SESSION_IDLE_TIMEOUT}s)"
@@ -206,12 +206,33 @@ class ConnectionManager:
         self._sessions.pop(session_id, None)
         await assistant.stop()
 
-    async def close_session(self, session_id: str) -> None:
-        """Stop and remove assistant instance, cancel any idle timer."""
+    def _remove_session(self, session_id: str) -> Assistant | None:
+        """Drop all bookkeeping for a session and return its assistant."""
         self._cancel_idle_timer(session_id)
         self._ws_refcount.pop(session_id, None)
         self._session_meta.pop(session_id, None)
-        assistant = self._sessions.pop(session_id, None)
+        return self._sessions.pop(session_id, None)
+
+    async def _close_idle_session(self, session_id: str) -> None:
+        """Idle-timer expiry: close the session unless a WebSocket reattached.
+
+        The timer schedules this as a task, so a reconnect can run
+        ``get_or_create_assistant`` between the timer firing and this
+        coroutine starting. Re-check the refcount under the session lock.
+        """
+        async with self._session_lock:
+            if self._ws_refcount.get(session_id, 0) > 0:
+                logger.info(f"Session {session_id} reattached, skipping idle close")
+                return
+            assistant = self._remove_session(session_id)
+        if assistant is None:
+            return
+        await assistant.stop()
+        logger.info(f"Closed idle session: {session_id}")
+
+    async def close_session(self, session_id: str) -> None:
+        """Stop and remove assistant instance, cancel any idle timer."""
+        assistant = self._remove_session(session_id)
         if assistant is None:
             return
         await assistant.stop()
@@ -224,9 +245,17 @@ class ConnectionManager:
         self._idle_timers.clear()
         self._ws_refcount.clear()
 
+        # Each stop may wait on an in-flight turn and thread joins; run them
+        # concurrently so shutdown takes the slowest session, not the sum.
         ids = list(self._sessions.keys())
-        for sid in ids:
-            await self.close_session(sid)
+        results = await asyncio.gather(
+            *(self.close_session(sid) for sid in ids), return_exceptions=True,
+        )
+        for sid, result in zip(ids, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(
+                    f"Failed to close session {sid}", exc_info=result,
+                )
 
         recognizer = self._app_context.voiceprint_recognizer
         if recognizer:
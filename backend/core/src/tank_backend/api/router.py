@@ -31,6 +31,9 @@ logger = logging.getLogger("ApiRouter")
 
 router = APIRouter()
 
+# int16 -> float32 PCM scale (exact power of two, so results match a divide)
+_INV_INT16 = np.float32(1.0 / 32768.0)
+
 
 def _resample_pcm16(data: bytes, src_rate: int, dst_rate: int) -> bytes:
     """Resample int16 mono PCM from src_rate to dst_rate via linear interpolation.
@@ -582,9 +585,9 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
                 # Resample to the pipeline rate if the client captures differently
                 if cap_rate != pipeline_rate:
                     raw = _resample_pcm16(raw, cap_rate, pipeline_rate)
-                pcm_data = (
-                    np.frombuffer(raw, dtype=np.int16).astype(np.float32)
-                    / 32768.0
+                # One fused widen-and-scale pass instead of astype + divide
+                pcm_data = np.multiply(
+                    np.frombuffer(raw, dtype=np.int16), _INV_INT16, dtype=np.float32
                 )
                 frame = AudioFrame(
                     pcm=pcm_data, sample_rate=pipeline_rate, timestamp_s=time.time()
@@ -60,7 +60,7 @@ class SegmenterConfig:
 
     speech_threshold: float = 0.5
     min_speech_ms: int = 200
-    min_silence_ms: int = 1000
+    min_silence_ms: int = 500
     pre_roll_ms: int = 200
     max_utterance_ms: int = 20000
 
@@ -28,6 +28,18 @@ from .types import SegmenterConfig
 
 logger = logging.getLogger("VAD")
 
+# RMS level above which a partial (sub-chunk) buffer counts as voice.
+_ENERGY_THRESHOLD = 0.01
+
+# RMS level (-60 dBFS) below which a full chunk cannot start speech, so
+# Silero inference is skipped while the iterator is idle.
+_SILENCE_FLOOR = 0.001
+
+
+def _above_energy_threshold(pcm: np.ndarray, threshold: float = _ENERGY_THRESHOLD) -> bool:
+    """RMS energy check without squaring into a temporary array."""
+    return float(np.dot(pcm, pcm)) > threshold * threshold * len(pcm)
+
 
 class VADStatus(Enum):
     """Voice activity detection status."""
@@ -49,6 +61,11 @@ class VADResult:
     ended_at_s: float | None = None
 
 
+# Payload-free results are immutable, so every frame can share one instance.
+_NO_SPEECH_RESULT = VADResult(status=VADStatus.NO_SPEECH)
+_IN_SPEECH_RESULT = VADResult(status=VADStatus.IN_SPEECH)
+
+
 class VADEngine:
     """Process-global Silero VAD engine. Owns the ONNX model.
 
@@ -116,9 +133,12 @@ class VADStream:
         self._speech_started_at_s: float | None = None
         self._last_voice_at_s: float | None = None  # For silence timeout tracking
 
-        # Chunk buffering (for 512-sample chunks required by silero-vad)
-        self._chunk_buffer = np.array([], dtype=np.float32)
+        # Chunk buffering (for 512-sample chunks required by silero-vad).
+        # Frames are copied into one preallocated chunk; _chunk_fill is the
+        # number of samples currently held.
         self._chunk_size = 512  # Required chunk size for 16kHz
+        self._chunk_buffer = np.empty(self._chunk_size, dtype=np.float32)
+        self._chunk_fill = 0
         self._last_chunk_has_voice = False  # Track last processed chunk's voice state
 
         # Pre-roll buffer (ring buffer for audio before speech start)
@@ -150,23 +170,34 @@ class VADStream:
         """
         if len(chunk) < self._chunk_size:
             # Partial chunk, use energy threshold
-            energy = np.sqrt(np.mean(chunk**2))
-            return energy > 0.01
+            return _above_energy_threshold(chunk)
+
+        # Near-silent chunk while idle: nothing for the model to trigger on
+        if not self._vad_iterator.triggered and not _above_energy_threshold(
+            chunk, _SILENCE_FLOOR
+        ):
+            return False
 
         # Full chunk, use model inference
         result = self._vad_iterator(chunk, return_seconds=False)
         return result is not None
 
-    def _process_pending_chunks(self) -> bool | None:
-        """Process any complete chunks in the buffer."""
+    def _buffer_and_process(self, pcm: np.ndarray) -> bool | None:
+        """Copy *pcm* into the chunk buffer, processing each chunk it completes."""
         has_voice = None
+        offset = 0
 
-        while len(self._chunk_buffer) >= self._chunk_size:
-            chunk = self._chunk_buffer[: self._chunk_size]
-            self._chunk_buffer = self._chunk_buffer[self._chunk_size :]
+        while offset < len(pcm):
+            n = min(self._chunk_size - self._chunk_fill, len(pcm) - offset)
+            self._chunk_buffer[self._chunk_fill : self._chunk_fill + n] = pcm[offset : offset + n]
+            self._chunk_fill += n
+            offset += n
+            if self._chunk_fill < self._chunk_size:
+                break
 
-            chunk_has_voice = self._process_chunk(chunk)
+            chunk_has_voice = self._process_chunk(self._chunk_buffer)
             self._last_chunk_has_voice = chunk_has_voice
+            self._chunk_fill = 0
 
             has_voice = chunk_has_voice if has_voice is None else has_voice or chunk_has_voice
 
@@ -176,16 +207,13 @@ class VADStream:
         """
         Detect voice activity by buffering frames into chunks.
         """
-        self._chunk_buffer = np.concatenate([self._chunk_buffer, pcm])
-
-        chunk_result = self._process_pending_chunks()
+        chunk_result = self._buffer_and_process(pcm)
 
         if chunk_result is not None:
             return chunk_result
 
-        if len(self._chunk_buffer) > 0:
-            energy = np.sqrt(np.mean(self._chunk_buffer**2))
-            return energy > 0.01
+        if self._chunk_fill > 0:
+            return _above_energy_threshold(self._chunk_buffer[: self._chunk_fill])
 
         return self._last_chunk_has_voice
 
@@ -231,8 +259,9 @@ class VADStream:
         """
         Process a single audio frame.
         """
-        # Always update pre-roll buffer
-        self._pre_roll_buffer.append(pcm.copy())
+        # Always update pre-roll buffer. Frames are fresh arrays that nothing
+        # mutates (utterance parts keep them uncopied too), so hold a reference.
+        self._pre_roll_buffer.append(pcm)
 
         # Check silence timeout BEFORE processing voice activity
         if self._in_speech and self._last_voice_at_s is not None:
@@ -247,7 +276,7 @@ class VADStream:
                         self._speech_pcm_parts = []
                         self._speech_started_at_s = None
                         self._last_voice_at_s = None
-                        return VADResult(status=VADStatus.NO_SPEECH)
+                        return _NO_SPEECH_RESULT
 
                 return self._finalize_utterance(self._last_voice_at_s or timestamp_s)
 
@@ -255,7 +284,7 @@ class VADStream:
 
         if not self._in_speech:
             if not has_voice:
-                return VADResult(status=VADStatus.NO_SPEECH)
+                return _NO_SPEECH_RESULT
 
             # Voice start detected - include pre-roll in utterance
             self._in_speech = True
@@ -287,23 +316,23 @@ class VADStream:
         if has_voice:
             self._last_voice_at_s = timestamp_s
 
-        return VADResult(status=VADStatus.IN_SPEECH)
+        return _IN_SPEECH_RESULT
 
     def flush(self, now_s: float) -> VADResult:
         """Force finalize any in-progress speech."""
         if not self._in_speech:
-            return VADResult(status=VADStatus.NO_SPEECH)
+            return _NO_SPEECH_RESULT
 
-        if len(self._chunk_buffer) > 0:
-            self._process_chunk(self._chunk_buffer)
-            self._chunk_buffer = np.array([], dtype=np.float32)
+        # A partial chunk only gets an energy check with no side effects, so
+        # there is nothing to evaluate here; just drop it.
+        self._chunk_fill = 0
 
         if len(self._speech_pcm_parts) > 0:
             return self._finalize_utterance(now_s)
         self._in_speech = False
         self._speech_pcm_parts = []
         self._speech_started_at_s = None
-        return VADResult(status=VADStatus.NO_SPEECH)
+        return _NO_SPEECH_RESULT
 
 
 # Backward-compatible alias. Callers that used ``SileroVAD(cfg, sample_rate)``
@@ -236,31 +236,46 @@ class ConnectorManager:
     # ── Lifecycle ───────────────────────────────────────────────────
 
     async def start_all(self) -> None:
-        """Start every registered connector. Failures are logged but do
-        not abort — other connectors keep starting."""
-        for connector in self._connectors.values():
-            try:
-                await connector.start()
-                logger.info("Started connector '%s'", connector.instance_name)
-            except Exception:
-                logger.exception(
-                    "Failed to start connector '%s'", connector.instance_name,
-                )
+        """Start every registered connector concurrently.
+
+        Each start is an independent platform login/handshake, so startup
+        costs the slowest connector rather than the sum of all of them.
+        Failures are logged but do not abort — other connectors keep
+        starting.
+        """
+        await asyncio.gather(
+            *(self._start_one(c) for c in self._connectors.values()),
+        )
 
     async def stop_all(self) -> None:
-        """Stop every connector and release per-session consumers."""
-        for connector in self._connectors.values():
-            try:
-                await connector.stop()
-                logger.info("Stopped connector '%s'", connector.instance_name)
-            except Exception:
-                logger.exception(
-                    "Failed to stop connector '%s'", connector.instance_name,
-                )
+        """Stop every connector concurrently and release per-session consumers."""
+        await asyncio.gather(
+            *(self._stop_one(c) for c in self._connectors.values()),
+        )
         self._consumers.clear()
         self._dispatchers.clear()
         self._voice_dispatchers.clear()
 
+    @staticmethod
+    async def _start_one(connector: Connector) -> None:
+        try:
+            await connector.start()
+            logger.info("Started connector '%s'", connector.instance_name)
+        except Exception:
+            logger.exception(
+                "Failed to start connector '%s'", connector.instance_name,
+            )
+
+    @staticmethod
+    async def _stop_one(connector: Connector) -> None:
+        try:
+            await connector.stop()
+            logger.info("Stopped connector '%s'", connector.instance_name)
+        except Exception:
+            logger.exception(
+                "Failed to stop connector '%s'", connector.instance_name,
+            )
+
     # ── Dispatch ────────────────────────────────────────────────────
 
     async def _on_inbound(
@@ -400,37 +400,43 @@ class ContextManager:
     # Turn preparation — the key API for Brain
     # ------------------------------------------------------------------
 
-    def _build_augmented_system_prompt(self, base: str, user: str) -> str:
-        """Append USER.md, memory and preference sections to ``base``.
+    def _build_volatile_context(self, user: str) -> str:
+        """Render the volatile tier of the system prompt for ``user``.
 
         Sections (in order, each only when non-empty):
         - ``USER.md`` content (per-user override or default; sanitized)
         - ``KNOWN FACTS ({user})`` — flat memory pool from MemoryService
         - ``USER PREFERENCES ({user})`` — PreferenceStore output
 
-        These three are the **volatile** tier of the system prompt — they
-        change every turn (memory recall) or when the user edits USER.md.
-        Keeping them out of the assembler-cached prompt maximises
-        prompt-prefix cache hits at the LLM provider.
-
-        Guests get no augmentation. The block is rebuilt on every turn
-        because memory recall is per-turn — caching here would risk
+        These change every turn (memory recall) or when the user edits
+        USER.md, so they are kept out of the assembler-cached prompt.
+        Guests get no volatile context. The block is rebuilt on every
+        turn because memory recall is per-turn — caching here would risk
         showing stale facts when the user pivots topics.
         """
         if is_guest(user):
-            return base
-        out = base
+            return ""
+        sections: list[str] = []
         user_md = self._prompt_assembler.load_user_md()
         if user_md:
-            out += f"\n\n{user_md}"
+            sections.append(user_md)
         if self._memory_facts:
             rendered = "\n".join(f"- {m}" for m in self._memory_facts)
-            out += f"\n\nKNOWN FACTS ({user}):\n{rendered}"
+            sections.append(f"KNOWN FACTS ({user}):\n{rendered}")
         if self._preference_store:
             prefs = self._preference_store.render_for_user(user)
             if prefs:
-                out += f"\n\nUSER PREFERENCES ({user}):\n{prefs}"
-        return out
+                sections.append(f"USER PREFERENCES ({user}):\n{prefs}")
+        return "\n\n".join(sections)
+
+    def _build_augmented_system_prompt(self, base: str, user: str) -> str:
+        """Append the volatile tier to ``base`` as one system prompt.
+
+        Used for channel conversations, whose ChannelContextBuilder takes
+        a single system prompt.
+        """
+        volatile = self._build_volatile_context(user)
+        return f"{base}\n\n{volatile}" if volatile else base
 
     async def recall_memory(self, user: str, text: str) -> None:
         """Pre-fetch memory for the upcoming turn.
@@ -521,14 +527,16 @@ class ContextManager:
             if estimated > self._budget.effective_history_tokens:
                 await self.compact()
 
-        # Build augmented system prompt (memory + preferences)
+        # Destructive compaction: return full messages. The volatile tier
+        # (memory + preferences) goes in its own system message just before
+        # the new user turn, so the stable system prompt and the history
+        # stay a byte-identical prefix across turns for provider prompt
+        # caching. Folding it into messages[0] would change the very first
+        # message whenever memory recall returns different facts.
         messages = list(conv.messages)
-        base_system = messages[0]["content"] if messages else ""
-        augmented_system = self._build_augmented_system_prompt(base_system, user)
-
-        # Destructive compaction: return full messages with augmented system prompt
-        if augmented_system != messages[0]["content"]:
-            messages[0] = {"role": "system", "content": augmented_system}
+        volatile = self._build_volatile_context(user)
+        if volatile:
+            messages.insert(len(messages) - 1, {"role": "system", "content": volatile})
 
         if attachments:
             messages = await self._materialize_last_user_attachments(
@@ -599,8 +607,10 @@ class ContextManager:
     def get_system_prompt_refresher(self, user: str = "") -> Callable[[], str | None]:
         """Return a callback that refreshes the system prompt during LLM tool loops.
 
-        Returns the fully-augmented prompt (with memory) when rebuild is needed,
-        or None when the cached prompt is still valid (O(1) check).
+        Returns the new system prompt when rebuild is needed, or None when
+        the cached prompt is still valid (O(1) check). Channel conversations
+        get the augmented prompt (with memory); regular ones carry the
+        volatile tier in a separate message, so only the base is replaced.
         """
 
         def _refresh() -> str | None:
@@ -614,7 +624,12 @@ class ContextManager:
                 and self._conversation.messages[0].get("role") == "system"
             ):
                 self._conversation.messages[0]["content"] = new_prompt
-            return self._build_augmented_system_prompt(new_prompt, user)
+            if (
+                self._compaction_mode == CompactionMode.NON_DESTRUCTIVE
+                and self._channel_context_builder is not None
+            ):
+                return self._build_augmented_system_prompt(new_prompt, user)
+            return new_prompt
 
         return _refresh
 
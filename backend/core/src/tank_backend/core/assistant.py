@@ -54,6 +54,9 @@ logger = logging.getLogger("Assistant")
 # Clients receive this in the "ready" signal so they know what to capture at.
 PIPELINE_SAMPLE_RATE = 16000
 
+# Typed commands that shut the assistant down instead of being sent to the brain.
+_EXIT_COMMANDS = frozenset({"quit", "exit"})
+
 
 class Assistant:
     """Pipeline-based voice assistant orchestrator.
@@ -552,7 +555,7 @@ class Assistant:
         if not text or not text.strip():
             return
 
-        if text.lower() in ("quit", "exit"):
+        if text.strip().lower() in _EXIT_COMMANDS:
             self.shutdown_signal.stop()
             if self.on_exit_request:
                 self.on_exit_request()
@@ -12,6 +12,9 @@ class AudioOutputRequest:
     content: str
     language: str = "auto"
     voice: str | None = None
+    # False for all but the last request of a reply streamed sentence by
+    # sentence; playback only ends after the final one.
+    final: bool = True
 
 
 class InputType(Enum):
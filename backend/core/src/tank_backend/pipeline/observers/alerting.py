@@ -73,8 +73,8 @@ class AlertingObserver:
         # Alert cooldown: alert_type → last_fired_at
         self._last_alert_at: dict[str, float] = {}
 
-        # Alert history for snapshot
-        self._alerts: list[Alert] = []
+        # Alert history for snapshot (last 20 alerts)
+        self._alerts: deque[Alert] = deque(maxlen=20)
 
         # Subscribe to relevant bus messages
         bus.subscribe("asr_result", self._on_message)
@@ -223,7 +223,7 @@ class AlertingObserver:
                     "source": a.source,
                     "timestamp": a.timestamp,
                 }
-                for a in self._alerts[-20:]  # Last 20 alerts
+                for a in self._alerts
             ]
 
     def reset(self) -> None:
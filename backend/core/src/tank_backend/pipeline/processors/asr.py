@@ -245,8 +245,12 @@ class ASRProcessor(Processor):
             text = self._asr.process_pcm(self._to_asr_rate(item.pcm))
 
             if text and text != self._partial_text:
+                # A partial that only grew trailing whitespace looks the same
+                # on screen; don't send another UI update for it.
+                changed = text.rstrip() != self._partial_text.rstrip()
                 self._partial_text = text
-                self._post_partial(text)
+                if changed:
+                    self._post_partial(text)
 
             yield FlowReturn.OK, None
             return
@@ -321,13 +325,22 @@ class ASRProcessor(Processor):
 
     def handle_event(self, event: PipelineEvent) -> bool:
         if event.type == "flush":
-            # Timeout-protected stop — don't let a hung SDK block interrupt flow
-            try:
-                with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-                    future = pool.submit(self._asr.stop)
-                    future.result(timeout=_STOP_TIMEOUT_S)
-            except (concurrent.futures.TimeoutError, Exception):
-                logger.warning("ASR stop() during flush timed out or failed")
+            # Only a started session has anything to stop; an idle flush
+            # (the common interrupt case) skips the helper thread entirely.
+            if self._streaming_msg_id is not None:
+                self._stop_for_flush()
             self._reset_state()
             return False  # propagate
         return False
+
+    def _stop_for_flush(self) -> None:
+        """Timeout-protected stop — don't let a hung SDK block interrupt flow."""
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        try:
+            pool.submit(self._asr.stop).result(timeout=_STOP_TIMEOUT_S)
+        except (concurrent.futures.TimeoutError, Exception):
+            logger.warning("ASR stop() during flush timed out or failed")
+        finally:
+            # Don't join a hung worker; a ``with`` block would wait on it
+            # and defeat the timeout.
+            pool.shutdown(wait=False)
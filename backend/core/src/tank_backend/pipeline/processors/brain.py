@@ -23,6 +23,7 @@ from ..bus import Bus, BusMessage
 from ..event import PipelineEvent
 from ..processor import FlowReturn, Processor
 from .echo_guard import SelfEchoDetector
+from .sentence_chunker import SentenceChunker
 
 if TYPE_CHECKING:
     import threading
@@ -36,6 +37,30 @@ logger = logging.getLogger("Brain")
 
 _ACLOSE_TIMEOUT_S = 2.0
 
+# Spoken commands that only mean "stop talking". Speech barge-in has already
+# interrupted playback by the time the transcript arrives, so these are
+# answered without an LLM round-trip.
+_STOP_COMMANDS = frozenset({
+    "stop", "stop it", "stop talking", "be quiet", "shut up", "enough",
+    "停", "停止", "停下", "别说了", "不要说了", "闭嘴", "安静",
+})
+
+# Spoken requests to hear the previous reply again; replayed from the
+# sentences last sent to TTS instead of asking the LLM to restate them.
+# Multi-word phrases only: a bare "repeat" or "pardon" can be an answer
+# ("should the timer repeat?"), so those go to the LLM.
+_REPEAT_COMMANDS = frozenset({
+    "say that again", "say it again", "repeat that", "what did you say",
+    "再说一遍", "再说一次", "重复一遍",
+})
+
+# Trailing/leading punctuation ASR attaches to short commands ("Stop.", "停止。")
+_COMMAND_STRIP = " \t\n.,!?;:'\"。，！？；：、…"
+
+
+def _normalize_command(text: str) -> str:
+    return text.strip(_COMMAND_STRIP).lower()
+
 
 class Brain(Processor):
     """The Orchestrator: Process inputs and decide actions.
@@ -114,6 +139,9 @@ class Brain(Processor):
         self._echo_config = echo_guard_config or EchoGuardConfig()
         self._echo_detector = SelfEchoDetector(self._echo_config)
 
+        # Sentences of the last fully spoken reply, for repeat commands
+        self._last_reply: list[AudioOutputRequest] = []
+
         # Create ConversationResolver — owns conversation lifecycle decisions
         from ...context.resolver import ConversationResolver
 
@@ -400,6 +428,7 @@ class Brain(Processor):
         resolved = self._resolver.new(system_prompt)
         self._context.set_conversation(resolved)
         self._pending_store.clear_all()
+        self._last_reply = []
         logger.info("Conversation cleared — new: %s", self._context.conversation_id)
 
     def resume_conversation(self, conversation_id: str) -> bool:
@@ -409,6 +438,7 @@ class Brain(Processor):
         if resolved is None:
             return False
         self._context.set_conversation(resolved)
+        self._last_reply = []
         # Restore pending approvals from persisted state
         pending_data = self._context.pending_approvals
         if pending_data:
@@ -689,6 +719,39 @@ class Brain(Processor):
 
         # --- NORMAL mode: proceed with standard agent processing ---
 
+        command = _normalize_command(event.text) if event.type == InputType.AUDIO else ""
+        if command in _STOP_COMMANDS:
+            logger.info("Brain: stop command %r, skipping LLM", event.text)
+            yield FlowReturn.OK, None
+            return
+        if command in _REPEAT_COMMANDS and self._last_reply:
+            logger.info("Brain: repeat command %r, replaying last reply", event.text)
+            # Same signals as a normal turn, so the replay can be interrupted
+            # before its first chunk plays
+            self._interrupt_event.clear()
+            assistant_msg_id = f"assistant_{uuid.uuid4().hex[:8]}"
+            self._bus.post(BusMessage(
+                type="ui_message",
+                source=self.name,
+                payload=SignalMessage(signal_type="processing_started", msg_id=assistant_msg_id),
+            ))
+            try:
+                for audio_request in self._last_reply:
+                    if self._interrupt_event.is_set():
+                        break
+                    if audio_request.content:
+                        self._echo_detector.record_tts(audio_request.content)
+                    yield FlowReturn.OK, audio_request
+            finally:
+                self._bus.post(BusMessage(
+                    type="ui_message",
+                    source=self.name,
+                    payload=SignalMessage(
+                        signal_type="processing_ended", msg_id=assistant_msg_id,
+                    ),
+                ))
+            return
+
         self._interrupt_event.clear()
 
         started_at = time.time()
@@ -744,10 +807,18 @@ class Brain(Processor):
         ))
 
         try:
-            audio_request = await self._process_via_agents(
+            reply: list[AudioOutputRequest] = []
+            async for audio_request in self._process_via_agents(
                 messages, assistant_msg_id, language, event,
                 system_prompt_fn=system_prompt_fn,
-            )
+            ):
+                # Record TTS text for self-echo detection
+                if audio_request.content:
+                    self._echo_detector.record_tts(audio_request.content)
+                reply.append(audio_request)
+                yield FlowReturn.OK, audio_request
+            if reply:
+                self._last_reply = reply
 
             elapsed = time.time() - started_at
             logger.info("Brain response finished at %.3f, duration_s=%.3f", time.time(), elapsed)
@@ -778,12 +849,7 @@ class Brain(Processor):
                 },
             ))
 
-            # Yield AudioOutputRequest for TTS downstream
-            if audio_request is not None:
-                # Record TTS text for self-echo detection
-                self._echo_detector.record_tts(audio_request.content)
-                yield FlowReturn.OK, audio_request
-            else:
+            if not reply:
                 yield FlowReturn.OK, None
 
         except BrainInterrupted:
@@ -811,7 +877,11 @@ class Brain(Processor):
                     is_final=True,
                 ),
             ))
-            yield FlowReturn.OK, None
+            if reply and not reply[-1].final:
+                # Close out the sentences already sent so playback can end
+                yield FlowReturn.OK, AudioOutputRequest(content="")
+            else:
+                yield FlowReturn.OK, None
         finally:
             # Always send processing_ended signal
             self._bus.post(BusMessage(
@@ -829,8 +899,16 @@ class Brain(Processor):
         language: str,
         event: BrainInputEvent,
         system_prompt_fn: Any = None,
-    ) -> AudioOutputRequest | None:
-        """Process via AgentGraph."""
+    ) -> AsyncIterator[AudioOutputRequest]:
+        """Process via AgentGraph, yielding speech one sentence at a time.
+
+        Each completed sentence is yielded as soon as the LLM finishes it, so
+        TTS (on its own queue thread) synthesizes while the rest of the reply
+        is still streaming. Text buffered before a tool call is flushed so
+        the user hears it while the tool runs. Only the last request is
+        ``final``. The TTS voice language is detected per sentence, so a
+        mixed-language reply switches voice where its language does.
+        """
         from ...agents.base import AgentOutputType, AgentState
 
         state = AgentState(
@@ -843,6 +921,8 @@ class Brain(Processor):
         )
         self._current_msg_id = msg_id
         full_response_text = ""
+        chunker = SentenceChunker() if self._tts_enabled else None
+        spoke = False
 
         assert self._agent_graph is not None
         gen = self._agent_graph.run(state)
@@ -870,8 +950,31 @@ class Brain(Processor):
                     ),
                 ))
 
+                speech = ""
                 if output.type == AgentOutputType.TOKEN:
                     full_response_text += output.content
+                    if chunker is not None:
+                        speech = chunker.feed(output.content)
+                elif output.type == AgentOutputType.TOOL_CALLING and chunker is not None:
+                    speech = chunker.flush()
+
+                if speech:
+                    spoke = True
+                    yield AudioOutputRequest(
+                        content=speech,
+                        language=self._detect_response_language(speech),
+                        final=False,
+                    )
+
+            # The last request of the reply is marked final, so playback
+            # stays active (and interruptible) until the whole reply is spoken.
+            # An empty one only closes out a reply that ended on a break.
+            if chunker is not None:
+                speech = chunker.flush()
+                if speech or spoke:
+                    yield AudioOutputRequest(
+                        content=speech, language=self._detect_response_language(speech),
+                    )
 
             # Finalize UI block
             self._bus.post(BusMessage(
@@ -905,16 +1008,10 @@ class Brain(Processor):
                 full_response_text, msg_id,
             )
 
-            # Detect response language for TTS voice selection
-            if full_response_text.strip():
-                from ...core.language import detect_language
-                language = detect_language(
-                    full_response_text,
-                    candidates=self._languages,
-                    preferred=self._preferred_language,
-                ).language
-
+            # Voice replies on other transports synthesize the whole text at
+            # once, so detect on all of it rather than on one sentence.
             if full_response_text.strip():
+                language = self._detect_response_language(full_response_text)
                 self._bus.post(BusMessage(
                     type="outbound_voice",
                     source=self.name,
@@ -932,10 +1029,6 @@ class Brain(Processor):
                 self._context.schedule_memory_store(
                     event.user, event.text, full_response_text,
                 )
-                if self._tts_enabled:
-                    return AudioOutputRequest(content=full_response_text, language=language)
-
-            return None
 
         except BrainInterrupted:
             # Save what the assistant already said so the LLM has context
@@ -1077,12 +1170,7 @@ class Brain(Processor):
 
             if full_response_text:
                 # Detect response language for TTS voice selection
-                from ...core.language import detect_language
-                language = detect_language(
-                    full_response_text,
-                    candidates=self._languages,
-                    preferred=self._preferred_language,
-                ).language
+                language = self._detect_response_language(full_response_text)
 
                 turn_messages = state.metadata.get("turn_messages", [])
                 self._finish_turn(turn_messages)
@@ -1190,17 +1278,18 @@ class Brain(Processor):
         ))
 
         try:
-            audio_request = await self._process_via_agents(
+            spoke = False
+            async for audio_request in self._process_via_agents(
                 messages, assistant_msg_id, language, event,
-            )
+            ):
+                self._echo_detector.record_tts(audio_request.content)
+                spoke = True
+                yield FlowReturn.OK, audio_request
 
             elapsed = time.time() - started_at
             logger.info("Brain notification turn finished: %.3fs", elapsed)
 
-            if audio_request is not None:
-                self._echo_detector.record_tts(audio_request.content)
-                yield FlowReturn.OK, audio_request
-            else:
+            if not spoke:
                 yield FlowReturn.OK, None
 
         except BrainInterrupted:
@@ -1234,6 +1323,16 @@ class Brain(Processor):
             self._qos_skip_tools = True
             logger.info("Brain QoS: skipping tool calls (severity=%.2f)", severity)
 
+    def _detect_response_language(self, text: str) -> str:
+        """Detect the reply language used to pick the TTS voice."""
+        from ...core.language import detect_language
+
+        return detect_language(
+            text,
+            candidates=self._languages,
+            preferred=self._preferred_language,
+        ).language
+
     @staticmethod
     def _get_error_message(language: str | None) -> str:
         """Get error message in user's language."""
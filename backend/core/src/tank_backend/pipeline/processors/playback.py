@@ -43,9 +43,14 @@ class PlaybackProcessor(Processor):
         if self._bus:
             self._bus.subscribe("tts_finished", self._on_tts_finished)
 
-    def _on_tts_finished(self, _message: BusMessage) -> None:
-        """TTS has finished generating — signal playback ended."""
-        self._signal_playback_ended()
+    def _on_tts_finished(self, message: BusMessage) -> None:
+        """TTS has finished the last request of a reply — signal playback ended.
+
+        Brain streams a reply as several sentence-sized requests; ending on
+        each one would drop the echo guard and barge-in between sentences.
+        """
+        if (message.payload or {}).get("final", True):
+            self._signal_playback_ended()
 
     async def process(self, item: Any) -> AsyncIterator[tuple[FlowReturn, Any]]:
         chunk: AudioChunk = item
@@ -59,11 +64,12 @@ class PlaybackProcessor(Processor):
 
         self._chunk_count += 1
 
-        # Signal playback started on first chunk
-        if self._chunk_count == 1:
+        # Signal playback started on the first chunk after the previous reply
+        # ended (final tts_finished, flush or interrupt)
+        if not self._playing:
             self._playing = True
             has_cb = self._playback_callback is not None
-            logger.info("PlaybackProcessor: received first chunk, callback=%s", has_cb)
+            logger.info("PlaybackProcessor: playback started, callback=%s", has_cb)
             if self._bus:
                 self._bus.post(BusMessage(
                     type="playback_started",
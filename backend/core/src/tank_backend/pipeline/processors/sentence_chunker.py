@@ -0,0 +1,105 @@
+"""Sentence chunker — splits streamed LLM text into speakable segments."""
+
+from __future__ import annotations
+
+# Terminators that always end a segment (CJK full-width punctuation, newline).
+_HARD_BREAKS = frozenset("。！？\n")
+
+# ASCII terminators only end a segment when followed by whitespace, so
+# "3.14", "example.com" and "v1.2" stay intact.
+_SOFT_BREAKS = frozenset(".!?")
+
+_FENCE = "```"
+
+# An unmatched "(" or "[" would otherwise hold back every later break until
+# the final flush; past this many characters it is treated as plain text.
+_MAX_BRACKET_HOLD = 200
+
+
+class SentenceChunker:
+    """Accumulates streamed tokens and releases complete sentences.
+
+    Lets the Brain hand each sentence to TTS while the LLM is still
+    generating the rest of the reply. Breaks are never placed inside a
+    fenced code block or inside markdown link/image brackets, so the TTS
+    normalizer still sees those constructs whole.
+    """
+
+    def __init__(self) -> None:
+        self._pending = ""
+        # Scan state kept between feed() calls so each character is examined
+        # once: next index to scan, bracket depth, index of the outermost
+        # open bracket, and whether the scan is inside a code fence.
+        self._pos = 0
+        self._depth = 0
+        self._open_at = 0
+        self._in_fence = False
+
+    def feed(self, text: str) -> str:
+        """Add streamed text; return the completed sentences, or ``""``."""
+        self._pending += text
+        cut = self._scan()
+        if cut == 0:
+            return ""
+        ready, self._pending = self._pending[:cut], self._pending[cut:]
+        self._pos -= cut
+        self._open_at -= cut
+        return ready.strip()
+
+    def flush(self) -> str:
+        """Return whatever is buffered (end of stream or before a tool call)."""
+        ready, self._pending = self._pending, ""
+        self._pos = self._depth = self._open_at = 0
+        self._in_fence = False
+        return ready.strip()
+
+    def _scan(self) -> int:
+        """Scan newly fed text; index just past the last safe break (0 if none).
+
+        Stops early where the next character is needed to decide (a possible
+        fence prefix, or an ASCII terminator at the end), and resumes there
+        on the next feed().
+        """
+        text = self._pending
+        n = len(text)
+        cut = 0
+        i = self._pos
+        while i < n:
+            if text.startswith(_FENCE, i):
+                self._in_fence = not self._in_fence
+                i += len(_FENCE)
+                continue
+            c = text[i]
+            if c == "`" and _FENCE.startswith(text[i:]):
+                break
+            if self._depth and i - self._open_at > _MAX_BRACKET_HOLD:
+                self._depth = 0
+            if self._in_fence:
+                pass
+            elif c in "[(":
+                if self._depth == 0:
+                    self._open_at = i
+                self._depth += 1
+            elif c in "])":
+                self._depth = max(self._depth - 1, 0)
+            elif self._depth == 0:
+                if c in _SOFT_BREAKS and i + 1 == n:
+                    break
+                if _is_break(text, i):
+                    cut = i + 1
+            i += 1
+        self._pos = i
+        return cut
+
+
+def _is_break(text: str, i: int) -> bool:
+    c = text[i]
+    if c in _HARD_BREAKS:
+        return True
+    return (
+        c in _SOFT_BREAKS
+        and i + 1 < len(text)
+        and text[i + 1].isspace()
+        # "1. item" / "costs 5. Then" — list markers, not sentence ends
+        and not (i > 0 and text[i - 1].isdigit())
+    )
@@ -53,6 +53,18 @@ class TTSProcessor(Processor):
         normalized_text = normalize_for_tts(request.content)
         if not normalized_text.strip():
             logger.info("TTSProcessor: nothing speakable after normalization, skipping")
+            if request.final and self._bus:
+                # Still close out a streamed reply whose last part is silent
+                self._bus.post(BusMessage(
+                    type="tts_finished",
+                    source=self.name,
+                    payload={
+                        "chunk_count": 0,
+                        "interrupted": False,
+                        "text_length": len(request.content),
+                        "final": True,
+                    },
+                ))
             return
 
         logger.info(
@@ -95,6 +107,7 @@ class TTSProcessor(Processor):
                     "chunk_count": chunk_count,
                     "interrupted": self._interrupted,
                     "text_length": len(request.content),
+                    "final": request.final,
                 },
             ))
 
@@ -123,6 +123,8 @@ class PromptAssembler:
         self._previous_scope = PromptScope()
         self._needs_rebuild = True
         self._cached_prompt: str = ""
+        # (source_path, block) → (raw content, sanitized content)
+        self._sanitized: dict[tuple[str, bool], tuple[str, str]] = {}
 
     # ------------------------------------------------------------------
     # Public API
@@ -252,7 +254,7 @@ class PromptAssembler:
             content = self._cache.read(agents_path)
             if content is None:
                 continue
-            sanitized = sanitize(content, source_path=agents_path, block=True)
+            sanitized = self._sanitize(content, source_path=agents_path, block=True)
             if sanitized:
                 parts.append(f"[From {agents_path}]\n{sanitized}")
 
@@ -267,7 +269,7 @@ class PromptAssembler:
         defaults_path = Path(self._config.defaults_dir) / filename
         content = self._cache.read(defaults_path)
         if content is not None:
-            return sanitize(content, source_path=str(defaults_path))
+            return self._sanitize(content, source_path=str(defaults_path))
         return None
 
     def _load_user_or_default(self, filename: str) -> str | None:
@@ -280,13 +282,13 @@ class PromptAssembler:
         content = self._cache.read(user_path)
         if content is not None:
             logger.debug("Loaded user file: %s", user_path)
-            return sanitize(content, source_path=str(user_path), block=True)
+            return self._sanitize(content, source_path=str(user_path), block=True)
 
         defaults_path = Path(self._config.defaults_dir) / filename
         content = self._cache.read(defaults_path)
         if content is not None:
             logger.debug("Loaded default file: %s", defaults_path)
-            return sanitize(content, source_path=str(defaults_path))
+            return self._sanitize(content, source_path=str(defaults_path))
 
         logger.warning(
             "Prompt file not found: %s (checked %s and %s)",
@@ -296,6 +298,20 @@ class PromptAssembler:
         )
         return None
 
+    def _sanitize(self, content: str, source_path: str, *, block: bool = False) -> str:
+        """:func:`sanitize` with the result reused until the file content changes.
+
+        USER.md is reloaded every turn for the volatile tier; without this
+        the per-character scan and injection regexes rerun on identical text.
+        """
+        key = (source_path, block)
+        cached = self._sanitized.get(key)
+        if cached is not None and cached[0] == content:
+            return cached[1]
+        result = sanitize(content, source_path=source_path, block=block)
+        self._sanitized[key] = (content, result)
+        return result
+
     # ------------------------------------------------------------------
     # Section builders
     # ------------------------------------------------------------------
@@ -311,7 +327,7 @@ class PromptAssembler:
             content = self._cache.read(agents_path)
             if content is None:
                 continue
-            sanitized = sanitize(content, source_path=agents_path, block=True)
+            sanitized = self._sanitize(content, source_path=agents_path, block=True)
             if sanitized:
                 parts.append(f"[From {agents_path}]\n{sanitized}")
 
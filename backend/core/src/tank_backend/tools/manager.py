@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import json
 import logging
+import re
 from typing import Any
 
 from .base import (
@@ -22,6 +23,9 @@ from .base import (
 
 logger = logging.getLogger("ToolManager")
 
+# Text-form tool call, e.g. ``get_weather({"location": "Paris"})``
+_TOOL_CALL_RE = re.compile(r"(\w+)\((.*?)\)")
+
 
 class ToolManager:
     """Registry + domain owner for all tools.
@@ -41,6 +45,9 @@ class ToolManager:
         self.tool_metadata: dict[str, ToolMetadata] = {}
         self._groups: list[ToolGroup] = []
         self._bus = bus
+        # OpenAI function schemas keyed by tool name, paired with the tool
+        # they were built from; rebuilt only when that name is re-registered.
+        self._openai_schemas: dict[str, tuple[BaseTool, dict[str, Any]]] = {}
         # Phase 18: session-scoped resources tools opt into via the
         # ``ToolContext`` kwarg. ``media_store`` is set once at startup;
         # ``session_id`` is updated per session via
@@ -450,59 +457,64 @@ class ToolManager:
             exclude: Optional set of tool names to omit from the result.
         """
         openai_tools = []
+        for name, tool in self.tools.items():
+            if exclude and name in exclude:
+                continue
+            cached = self._openai_schemas.get(name)
+            if cached is None or cached[0] is not tool:
+                cached = (tool, self._build_openai_tool(tool))
+                self._openai_schemas[name] = cached
+            openai_tools.append(cached[1])
 
-        for tool in self.tools.values():
-            info = tool.get_info()
+        return openai_tools
 
-            if exclude and info.name in exclude:
-                continue
+    @staticmethod
+    def _build_openai_tool(tool: BaseTool) -> dict[str, Any]:
+        """Build the OpenAI function-calling schema for one tool."""
+        info = tool.get_info()
 
-            raw_schema = tool.get_raw_schema()
-            if raw_schema is not None:
-                parameters = raw_schema
-            else:
-                properties = {}
-                required = []
-
-                for param in info.parameters:
-                    prop: dict[str, Any] = {
-                        "type": param.type,
-                        "description": param.description,
-                    }
-                    # OpenAI's function-calling schema (and Azure /
-                    # OpenRouter / Anthropic relays) reject ``"array"``
-                    # types that don't declare ``items``. Provide a
-                    # permissive default so a tool author who declares
-                    # ``ToolParameter(type="array", ...)`` without
-                    # overriding :meth:`BaseTool.get_raw_schema` doesn't
-                    # break the entire tool list. ``items: {}`` matches
-                    # any element shape; tools that need a tighter
-                    # constraint (chart_tool, file_search) ship a raw
-                    # schema via ``get_raw_schema``.
-                    if param.type == "array":
-                        prop["items"] = {}
-                    properties[param.name] = prop
-                    if param.required:
-                        required.append(param.name)
-
-                parameters = {
-                    "type": "object",
-                    "properties": properties,
-                    "required": required,
-                }
+        raw_schema = tool.get_raw_schema()
+        if raw_schema is not None:
+            parameters = raw_schema
+        else:
+            properties = {}
+            required = []
 
-            openai_tool = {
-                "type": "function",
-                "function": {
-                    "name": info.name,
-                    "description": info.description,
-                    "parameters": parameters,
-                },
+            for param in info.parameters:
+                prop: dict[str, Any] = {
+                    "type": param.type,
+                    "description": param.description,
+                }
+                # OpenAI's function-calling schema (and Azure /
+                # OpenRouter / Anthropic relays) reject ``"array"``
+                # types that don't declare ``items``. Provide a
+                # permissive default so a tool author who declares
+                # ``ToolParameter(type="array", ...)`` without
+                # overriding :meth:`BaseTool.get_raw_schema` doesn't
+                # break the entire tool list. ``items: {}`` matches
+                # any element shape; tools that need a tighter
+                # constraint (chart_tool, file_search) ship a raw
+                # schema via ``get_raw_schema``.
+                if param.type == "array":
+                    prop["items"] = {}
+                properties[param.name] = prop
+                if param.required:
+                    required.append(param.name)
+
+            parameters = {
+                "type": "object",
+                "properties": properties,
+                "required": required,
             }
 
-            openai_tools.append(openai_tool)
-
-        return openai_tools
+        return {
+            "type": "function",
+            "function": {
+                "name": info.name,
+                "description": info.description,
+                "parameters": parameters,
+            },
+        }
 
     async def execute_openai_tool_call(self, tool_call) -> ToolResult | str:
         """Execute tool from OpenAI function call format."""
@@ -519,10 +531,7 @@ class ToolManager:
         return await self.execute_tool(function_name, **arguments)
 
     def parse_tool_call(self, text: str) -> dict[str, Any] | None:
-        import re
-
-        tool_pattern = r"(\w+)\((.*?)\)"
-        match = re.search(tool_pattern, text)
+        match = _TOOL_CALL_RE.search(text)
 
         if match:
             tool_name = match.group(1)
@@ -223,6 +223,19 @@ class TestAlertingObserverSnapshot:
         assert len(snap) >= 1
         assert snap[0]["alert_type"] == "processor_failure"
 
+    def test_alert_history_bounded(self):
+        """Long-running sessions keep only the most recent alerts."""
+        bus = Bus()
+        observer = AlertingObserver(bus=bus)
+        for i in range(25):
+            observer._post_alert(Alert(
+                alert_type=f"test_{i}", severity="warning", message="test", source="test"
+            ))
+        assert len(observer._alerts) == 20
+        snap = observer.snapshot()
+        assert snap[0]["alert_type"] == "test_5"
+        assert snap[-1]["alert_type"] == "test_24"
+
     def test_reset_clears_state(self):
         bus = Bus()
         observer = AlertingObserver(bus=bus)
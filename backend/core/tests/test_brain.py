@@ -6,7 +6,9 @@ from unittest.mock import MagicMock
 import pytest
 from brain_test_helpers import make_brain, make_mock_context
 
-from tank_backend.core.events import BrainInputEvent, InputType
+from tank_backend.agents.base import Agent, AgentOutput, AgentOutputType
+from tank_backend.agents.graph import AgentGraph
+from tank_backend.core.events import BrainInputEvent, InputType, SignalMessage
 from tank_backend.pipeline.bus import Bus
 from tank_backend.pipeline.processor import FlowReturn, Processor
 from tank_backend.pipeline.processors.brain import BrainConfig
@@ -160,6 +162,104 @@ class TestBrain:
         assert len(discarded) == 1
         assert discarded[0].payload["reason"] == "self_echo"
 
+    async def test_brain_skips_llm_for_spoken_stop_command(self, brain, mock_context):
+        """A bare spoken "stop" is handled by barge-in; no LLM turn is started."""
+        for text in ("Stop.", "停止。", " be quiet! "):
+            event = BrainInputEvent(
+                type=InputType.AUDIO, text=text, user="User", language=None, confidence=None,
+            )
+            assert await _collect(brain, event) == [(FlowReturn.OK, None)]
+        mock_context.prepare_turn.assert_not_called()
+
+    @staticmethod
+    def _replying_brain(bus):
+        """Brain whose agent answers every turn with two sentences."""
+
+        class ReplyAgent(Agent):
+            def __init__(self):
+                super().__init__("reply")
+
+            async def run(self, state):
+                for tok in ("It is sunny. ", "High of 25."):
+                    yield AgentOutput(
+                        type=AgentOutputType.TOKEN, content=tok, metadata={"turn": 1},
+                    )
+                yield AgentOutput(type=AgentOutputType.DONE)
+
+        graph = AgentGraph(agents={"reply": ReplyAgent()}, default_agent="reply")
+        return make_brain(bus=bus, agent_graph=graph)
+
+    async def test_brain_replays_last_reply_for_repeat_command(self, bus):
+        """"Say that again" re-speaks the previous reply without an LLM turn."""
+        brain = self._replying_brain(bus)
+        turn = BrainInputEvent(
+            type=InputType.AUDIO, text="Weather?", user="User", language=None, confidence=None,
+        )
+        spoken = [out for _, out in await _collect(brain, turn) if out is not None]
+        brain._context.prepare_turn.reset_mock()
+        signals = []
+        bus.subscribe(
+            "ui_message",
+            lambda m: isinstance(m.payload, SignalMessage) and signals.append(m.payload),
+        )
+        bus.poll()
+        signals.clear()
+
+        repeat = BrainInputEvent(
+            type=InputType.AUDIO, text="Say that again?", user="User",
+            language=None, confidence=None,
+        )
+        results = await _collect(brain, repeat)
+        bus.poll()
+
+        assert [out.content for out in spoken] == ["It is sunny.", "High of 25."]
+        assert [out for _, out in results] == spoken
+        brain._context.prepare_turn.assert_not_called()
+        # Wrapped like a normal turn so the replay can be interrupted
+        assert [sig.signal_type for sig in signals] == ["processing_started", "processing_ended"]
+
+    @pytest.mark.parametrize("text", ["Repeat.", "pardon", "Come again?"])
+    async def test_ambiguous_single_words_are_not_repeat_commands(self, bus, text):
+        """A bare "repeat" may answer a question, so it starts a normal turn."""
+        brain = self._replying_brain(bus)
+        turn = BrainInputEvent(
+            type=InputType.AUDIO, text="Weather?", user="User", language=None, confidence=None,
+        )
+        await _collect(brain, turn)
+        brain._context.prepare_turn.reset_mock()
+
+        answer = BrainInputEvent(
+            type=InputType.AUDIO, text=text, user="User", language=None, confidence=None,
+        )
+        await _collect(brain, answer)
+
+        brain._context.prepare_turn.assert_called_once()
+
+    @pytest.mark.parametrize("switch", ["reset", "resume", "new"])
+    async def test_conversation_switch_forgets_last_reply(self, bus, switch):
+        brain = self._replying_brain(bus)
+        turn = BrainInputEvent(
+            type=InputType.AUDIO, text="Weather?", user="User", language=None, confidence=None,
+        )
+        await _collect(brain, turn)
+
+        if switch == "reset":
+            brain.reset_conversation()
+        elif switch == "resume":
+            assert brain.resume_conversation("other")
+        else:
+            brain.new_conversation()
+        brain._context.prepare_turn.reset_mock()
+
+        repeat = BrainInputEvent(
+            type=InputType.AUDIO, text="Say that again", user="User",
+            language=None, confidence=None,
+        )
+        await _collect(brain, repeat)
+
+        # Nothing to replay, so the request goes to the LLM as a normal turn
+        brain._context.prepare_turn.assert_called_once()
+
     async def test_brain_does_not_apply_echo_guard_to_text_input(
         self, brain, bus, mock_context
     ):
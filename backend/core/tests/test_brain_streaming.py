@@ -1,6 +1,7 @@
 """Tests for Brain streaming LLM responses as a Processor."""
 
 import threading
+from unittest.mock import patch
 
 import pytest
 from brain_test_helpers import make_brain, make_mock_context
@@ -154,3 +155,153 @@ async def test_interrupted_response_saved_to_context(bus):
     saved_arg = ctx.finish_turn.call_args[0][0]
     # finish_turn now receives the turn_messages list
     assert isinstance(saved_arg, list)
+
+
+async def test_brain_yields_sentences_while_llm_streams(bus):
+    """Each completed sentence reaches TTS before the rest of the reply is generated."""
+    emitted: list[str] = []
+
+    class TwoSentenceAgent(Agent):
+        def __init__(self):
+            super().__init__("two_sentences")
+
+        async def run(self, state):
+            for tok in ("Hello there. ", "How are ", "you?"):
+                emitted.append(tok)
+                yield AgentOutput(type=AgentOutputType.TOKEN, content=tok, metadata={"turn": 1})
+            yield AgentOutput(type=AgentOutputType.DONE)
+
+    graph = AgentGraph(agents={"two_sentences": TwoSentenceAgent()}, default_agent="two_sentences")
+    brain = make_brain(bus=bus, agent_graph=graph)
+    event = BrainInputEvent(
+        type=InputType.TEXT, text="hi", user="User", language="en", confidence=None,
+    )
+
+    spoken = []
+    async for _status, output in brain.process(event):
+        if output is not None:
+            spoken.append((output.content, len(emitted), output.language))
+
+    assert [(text, seen) for text, seen, _ in spoken] == [
+        ("Hello there.", 1),
+        ("How are you?", 3),
+    ]
+    # Only the last sentence ends the reply's playback
+    assert [r.final for r in brain._last_reply] == [False, True]
+    # Whole reply is kept for "say that again"
+    assert [r.content for r in brain._last_reply] == ["Hello there.", "How are you?"]
+
+
+async def test_reply_ending_on_a_break_gets_an_empty_final_request(bus):
+    """Every sentence was released by feed(); an empty request closes the reply."""
+
+    class BreakAgent(Agent):
+        def __init__(self):
+            super().__init__("break")
+
+        async def run(self, state):
+            yield AgentOutput(type=AgentOutputType.TOKEN, content="Done.\n", metadata={"turn": 1})
+            yield AgentOutput(type=AgentOutputType.DONE)
+
+    graph = AgentGraph(agents={"break": BreakAgent()}, default_agent="break")
+    brain = make_brain(bus=bus, agent_graph=graph)
+    event = BrainInputEvent(
+        type=InputType.TEXT, text="hi", user="User", language="en", confidence=None,
+    )
+
+    results = await _collect(brain, event)
+
+    assert [(out.content, out.final) for _, out in results] == [("Done.", False), ("", True)]
+
+
+async def test_brain_speaks_buffered_text_before_tool_call(bus):
+    """Text without a sentence end is flushed to TTS when a tool call starts."""
+
+    class ToolAgent(Agent):
+        def __init__(self):
+            super().__init__("tool")
+
+        async def run(self, state):
+            yield AgentOutput(
+                type=AgentOutputType.TOKEN, content="Let me check", metadata={"turn": 1},
+            )
+            yield AgentOutput(
+                type=AgentOutputType.TOOL_CALLING, content="",
+                metadata={"index": 0, "name": "get_weather", "status": "calling"},
+            )
+            yield AgentOutput(
+                type=AgentOutputType.TOKEN, content="It is sunny.", metadata={"turn": 2},
+            )
+            yield AgentOutput(type=AgentOutputType.DONE)
+
+    graph = AgentGraph(agents={"tool": ToolAgent()}, default_agent="tool")
+    brain = make_brain(bus=bus, agent_graph=graph)
+    event = BrainInputEvent(
+        type=InputType.TEXT, text="weather?", user="User", language="en", confidence=None,
+    )
+
+    results = await _collect(brain, event)
+
+    assert [out.content for _, out in results if out is not None] == [
+        "Let me check",
+        "It is sunny.",
+    ]
+
+
+def _fake_detect(text: str) -> str:
+    return "zh" if any("\u4e00" <= c <= "\u9fff" for c in text) else "en"
+
+
+async def test_outbound_voice_language_is_detected_on_full_reply(bus):
+    """A short first sentence must not decide the language of the whole voice reply."""
+
+    class ReplyAgent(Agent):
+        def __init__(self):
+            super().__init__("reply")
+
+        async def run(self, state):
+            for tok in ("OK. ", "好的，我来查一下。"):
+                yield AgentOutput(type=AgentOutputType.TOKEN, content=tok, metadata={"turn": 1})
+            yield AgentOutput(type=AgentOutputType.DONE)
+
+    graph = AgentGraph(agents={"reply": ReplyAgent()}, default_agent="reply")
+    brain = make_brain(bus=bus, agent_graph=graph)
+    voice_payloads = []
+    bus.subscribe("outbound_voice", lambda m: voice_payloads.append(m.payload))
+    event = BrainInputEvent(
+        type=InputType.TEXT, text="hi", user="User", language="en", confidence=None,
+    )
+
+    with patch.object(brain, "_detect_response_language", side_effect=_fake_detect) as detect:
+        await _collect(brain, event)
+    bus.poll()
+
+    assert voice_payloads[0]["language"] == "zh"
+    detect.assert_any_call("OK. 好的，我来查一下。")
+
+
+async def test_each_sentence_is_voiced_in_its_own_language(bus):
+    """A mixed-language reply switches TTS voice per sentence."""
+
+    class ReplyAgent(Agent):
+        def __init__(self):
+            super().__init__("reply")
+
+        async def run(self, state):
+            for tok in ("OK. ", "好的，我来查一下。"):
+                yield AgentOutput(type=AgentOutputType.TOKEN, content=tok, metadata={"turn": 1})
+            yield AgentOutput(type=AgentOutputType.DONE)
+
+    graph = AgentGraph(agents={"reply": ReplyAgent()}, default_agent="reply")
+    brain = make_brain(bus=bus, agent_graph=graph)
+    event = BrainInputEvent(
+        type=InputType.TEXT, text="hi", user="User", language="en", confidence=None,
+    )
+
+    with patch.object(brain, "_detect_response_language", side_effect=_fake_detect):
+        results = await _collect(brain, event)
+
+    assert [(out.content, out.language) for _, out in results if out.content] == [
+        ("OK.", "en"),
+        ("好的，我来查一下。", "zh"),
+    ]
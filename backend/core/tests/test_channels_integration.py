@@ -555,6 +555,7 @@ class TestChannelContextManager:
         ctx.set_conversation(resolved)
 
         messages = await ctx.prepare_turn("test-user", "Question")
-        # Regular: returns all messages (system + user + assistant + new user)
-        assert len(messages) == 4
+        # Regular: system + history + volatile context (own system message) + new user
+        assert len(messages) == 5
+        assert messages[-2]["role"] == "system"
         assert messages[-1]["content"] == "Question"
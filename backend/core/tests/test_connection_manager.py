@@ -0,0 +1,92 @@
+"""Tests for ConnectionManager session lifecycle."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from tank_backend.api.manager import ConnectionManager
+
+
+def _make_manager() -> ConnectionManager:
+    ctx = MagicMock()
+    ctx.voiceprint_recognizer = None
+    return ConnectionManager(app_context=ctx)
+
+
+class TestCloseAll:
+    @pytest.mark.asyncio
+    async def test_stops_sessions_concurrently(self):
+        mgr = _make_manager()
+        running = 0
+        peak = 0
+
+        async def slow_stop():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        for sid in ("a", "b", "c"):
+            assistant = MagicMock()
+            assistant.stop = AsyncMock(side_effect=slow_stop)
+            mgr._sessions[sid] = assistant
+
+        await mgr.close_all()
+
+        assert peak == 3
+        assert mgr._sessions == {}
+
+    @pytest.mark.asyncio
+    async def test_failing_session_does_not_block_others(self):
+        mgr = _make_manager()
+        bad = MagicMock()
+        bad.stop = AsyncMock(side_effect=RuntimeError("boom"))
+        good = MagicMock()
+        good.stop = AsyncMock()
+        mgr._sessions["bad"] = bad
+        mgr._sessions["good"] = good
+
+        await mgr.close_all()
+
+        good.stop.assert_awaited_once()
+        assert mgr._sessions == {}
+
+    @pytest.mark.asyncio
+    async def test_closes_shared_voiceprint_recognizer(self):
+        mgr = _make_manager()
+        recognizer = MagicMock()
+        mgr._app_context.voiceprint_recognizer = recognizer
+
+        await mgr.close_all()
+
+        recognizer.close.assert_called_once()
+
+
+class TestIdleClose:
+    @pytest.mark.asyncio
+    async def test_skips_session_that_reattached(self):
+        mgr = _make_manager()
+        assistant = MagicMock()
+        assistant.stop = AsyncMock()
+        mgr._sessions["s1"] = assistant
+        # A reconnect bumped the refcount after the timer fired
+        mgr._ws_refcount["s1"] = 1
+
+        await mgr._close_idle_session("s1")
+
+        assistant.stop.assert_not_awaited()
+        assert mgr.get_assistant("s1") is assistant
+
+    @pytest.mark.asyncio
+    async def test_closes_detached_session(self):
+        mgr = _make_manager()
+        assistant = MagicMock()
+        assistant.stop = AsyncMock()
+        mgr._sessions["s1"] = assistant
+
+        await mgr._close_idle_session("s1")
+
+        assistant.stop.assert_awaited_once()
+        assert mgr.get_assistant("s1") is None
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -184,6 +185,32 @@ class TestLifecycle:
         # Healthy connector still started.
         assert healthy.connected
 
+    async def test_start_all_runs_connectors_concurrently(
+        self, manager: ConnectorManager,
+    ) -> None:
+        """A slow connector handshake must not delay the others."""
+        started = asyncio.Event()
+        slow = FakeConnector("slow")
+
+        async def _slow_start() -> None:
+            await started.wait()
+
+        slow.start = _slow_start  # type: ignore[assignment, method-assign]
+        fast = FakeConnector("fast")
+        original_fast_start = fast.start
+
+        async def _fast_start() -> None:
+            await original_fast_start()
+            started.set()
+
+        fast.start = _fast_start  # type: ignore[assignment, method-assign]
+        manager.register(slow)
+        manager.register(fast)
+
+        # Sequential start would block forever on the slow connector.
+        await asyncio.wait_for(manager.start_all(), timeout=1.0)
+        assert fast.connected
+
 
 class TestInboundDispatch:
     async def test_inbound_requests_text_only_session(
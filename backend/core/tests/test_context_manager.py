@@ -145,9 +145,28 @@ class TestPrepareTurn:
         mgr._memory_facts = ["likes Python"]
 
         messages = await mgr.prepare_turn("Jackson", "hello")
-        system_content = messages[0]["content"]
-        assert "KNOWN FACTS (Jackson)" in system_content
-        assert "likes Python" in system_content
+        # Volatile context sits just before the new user turn, not in messages[0]
+        volatile = messages[-2]
+        assert volatile["role"] == "system"
+        assert "KNOWN FACTS (Jackson)" in volatile["content"]
+        assert "likes Python" in volatile["content"]
+        assert "likes Python" not in messages[0]["content"]
+        assert messages[-1]["content"] == "hello"
+
+    async def test_history_prefix_stable_when_memory_changes(self):
+        mgr = _make_manager()
+        _load_conversation(mgr)
+        mgr._memory_facts = ["likes Python"]
+        first = await mgr.prepare_turn("Jackson", "hello")
+        mgr.finish_turn([{"role": "assistant", "content": "Hi!"}])
+
+        mgr._memory_facts = ["likes Rust"]
+        second = await mgr.prepare_turn("Jackson", "and now?")
+
+        # Everything the provider saw before the first turn's volatile block
+        # is resent unchanged
+        assert second[: len(first) - 2] == first[:-2]
+        assert "likes Rust" in second[-2]["content"]
 
     def test_finish_turn_records_turn_messages(self):
         mgr = _make_manager()
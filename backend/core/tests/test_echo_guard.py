@@ -268,6 +268,102 @@ class TestPlaybackProcessorSignals:
         bus.poll()
         assert len(messages) == 1
 
+    async def test_playback_restarts_for_next_tts_request(self):
+        """A streamed reply's next sentence re-posts playback_started after tts_finished."""
+        bus = Bus()
+        messages = []
+        bus.subscribe("playback_started", lambda m: messages.append(m))
+
+        from tank_backend.pipeline.processors.playback import PlaybackProcessor
+
+        proc = PlaybackProcessor(playback_callback=MagicMock(), bus=bus)
+
+        chunk = MagicMock()
+        chunk.pcm = np.ones(160, dtype=np.float32)
+
+        async for _status, _output in proc.process(chunk):
+            pass
+        bus.post(BusMessage(type="tts_finished", source="tts", payload={}))
+        bus.poll()
+        async for _status, _output in proc.process(chunk):
+            pass
+
+        bus.poll()
+        assert len(messages) == 2
+
+    async def test_streamed_reply_posts_one_playback_started_and_ended(self):
+        """Sentences of one reply keep playback active between them."""
+        from tank_backend.core.events import AudioOutputRequest
+        from tank_backend.pipeline.processors.playback import PlaybackProcessor
+        from tank_backend.pipeline.processors.tts import TTSProcessor
+
+        bus = Bus()
+        started, ended = [], []
+        bus.subscribe("playback_started", lambda m: started.append(m))
+        bus.subscribe("playback_ended", lambda m: ended.append(m))
+
+        chunk = MagicMock()
+        chunk.pcm = np.ones(160, dtype=np.float32)
+
+        async def fake_stream(*args, **kwargs):
+            yield chunk
+            yield chunk
+
+        engine = MagicMock()
+        engine.generate_stream = MagicMock(side_effect=fake_stream)
+        tts = TTSProcessor(tts_engine=engine, bus=bus)
+        playback = PlaybackProcessor(playback_callback=MagicMock(), bus=bus)
+
+        reply = [
+            AudioOutputRequest(content="Hello there.", language="en", final=False),
+            AudioOutputRequest(content="How are you?", language="en"),
+        ]
+        for request in reply:
+            async for _status, audio in tts.process(request):
+                async for _status, _output in playback.process(audio):
+                    pass
+            # tts_finished is handled on one poll; playback_ended lands on the next
+            bus.poll()
+            bus.poll()
+            if request is reply[0]:
+                # Gap between sentences: playback is still active
+                assert (len(started), len(ended)) == (1, 0)
+
+        assert (len(started), len(ended)) == (1, 1)
+
+    async def test_silent_final_request_still_ends_playback(self):
+        """A reply whose last request has nothing speakable still ends playback."""
+        from tank_backend.core.events import AudioOutputRequest
+        from tank_backend.pipeline.processors.playback import PlaybackProcessor
+        from tank_backend.pipeline.processors.tts import TTSProcessor
+
+        bus = Bus()
+        ended = []
+        bus.subscribe("playback_ended", lambda m: ended.append(m))
+
+        chunk = MagicMock()
+        chunk.pcm = np.ones(160, dtype=np.float32)
+
+        async def fake_stream(*args, **kwargs):
+            yield chunk
+
+        engine = MagicMock()
+        engine.generate_stream = MagicMock(side_effect=fake_stream)
+        tts = TTSProcessor(tts_engine=engine, bus=bus)
+        playback = PlaybackProcessor(playback_callback=MagicMock(), bus=bus)
+
+        async for _status, audio in tts.process(
+            AudioOutputRequest(content="Done.", language="en", final=False)
+        ):
+            async for _status, _output in playback.process(audio):
+                pass
+        async for _status, _output in tts.process(AudioOutputRequest(content="")):
+            pass
+        bus.poll()
+        bus.poll()
+
+        assert len(ended) == 1
+
     async def test_flush_posts_playback_ended(self):
         bus = Bus()
         messages = []
@@ -7,6 +7,8 @@ convenience works end-to-end with mocked sherpa.
 
 from __future__ import annotations
 
+import asyncio
+import threading
 from unittest.mock import MagicMock, patch
 
 import numpy as np
@@ -119,6 +121,38 @@ class TestTranscribeOnce:
 
         assert captured["stream"].closed, "stream.close() must run even on exception"
 
+    async def test_runs_off_the_event_loop(self) -> None:
+        """A slow batch decode must not block the caller's event loop."""
+        loop_thread = threading.get_ident()
+        stop_threads: list[int] = []
+        entered = threading.Event()
+        release = threading.Event()
+
+        class _BlockingStream(_FakeASRStream):
+            def stop(self) -> str:
+                stop_threads.append(threading.get_ident())
+                entered.set()
+                # Bounded, so a decode that wrongly runs on the loop fails
+                # the assertions below instead of deadlocking the test
+                release.wait(timeout=1)
+                return super().stop()
+
+        class _BlockingEngine(_FakeASREngine):
+            def create_stream(self) -> ASRStream:
+                return _BlockingStream(self._final_text)
+
+        engine = _BlockingEngine(final_text="done")
+        task = asyncio.create_task(engine.transcribe_once(np.zeros(1000, dtype=np.float32)))
+
+        assert await asyncio.to_thread(entered.wait, 1)
+        # The loop keeps running other work while stop() is blocked
+        await asyncio.sleep(0)
+        assert not task.done()
+        assert stop_threads[0] != loop_thread
+
+        release.set()
+        assert await task == "done"
+
 
 class TestEngineStreamIsolation:
     """Multiple streams from one engine don't share per-session state."""
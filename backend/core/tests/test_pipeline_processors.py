@@ -304,12 +304,21 @@ class TestASRProcessor:
         assert len(received) == 0
 
     async def test_flush_event_stops_asr(self):
+        from tank_backend.audio.input.vad import VADResult, VADStatus
+
         proc, asr = self._make_processor()
+        await _collect(proc, VADResult(status=VADStatus.START_SPEECH, started_at_s=BASE_TIME))
         event = PipelineEvent(type="flush")
         consumed = proc.handle_event(event)
         assert consumed is False
         asr.stop.assert_called_once()
 
+    async def test_flush_event_without_session_skips_stop(self):
+        proc, asr = self._make_processor()
+        consumed = proc.handle_event(PipelineEvent(type="flush"))
+        assert consumed is False
+        asr.stop.assert_not_called()
+
     # ── Streaming mode (START_SPEECH → AudioFrame → END_SPEECH) ───────────
 
     async def test_streaming_start_speech_starts_session(self):
@@ -525,6 +534,27 @@ class TestASRProcessor:
         assert len(received) == 2
         assert received[0].payload.signal_type == "speech_detected"
 
+    async def test_streaming_whitespace_only_change_no_ui_message(self):
+        """A partial that differs only by trailing whitespace is not re-posted."""
+        from tank_backend.audio.input.vad import VADResult, VADStatus
+
+        bus = Bus()
+        received = []
+        bus.subscribe("ui_message", lambda m: received.append(m))
+
+        proc, asr = self._make_processor(bus=bus)
+        asr.process_pcm = MagicMock(side_effect=["hello", "hello ", "hello world"])
+
+        start_speech = VADResult(status=VADStatus.START_SPEECH, started_at_s=BASE_TIME)
+        await _collect(proc, start_speech)
+        for i in range(3):
+            await _collect(proc, _make_audio_frame(timestamp_s=BASE_TIME + 0.02 * i))
+        bus.poll()
+
+        # speech_detected + "hello" + "hello world"
+        assert [m.payload.text for m in received[1:]] == ["hello", "hello world"]
+        assert proc._partial_text == "hello world"
+
     # ── _stop_with_timeout resilience ───────────────────────────────────────
 
     async def test_stop_with_timeout_succeeds(self):
@@ -1,6 +1,7 @@
 """Tests for prompts.assembler — PromptAssembler."""
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -11,6 +12,7 @@ from tank_backend.prompts.assembler import (
     TieredPrompt,
 )
 from tank_backend.prompts.resolver import AGENTS_FILENAME
+from tank_backend.prompts.sanitizer import sanitize
 
 
 class TestPromptAssembler:
@@ -62,6 +64,18 @@ class TestPromptAssembler:
         content = assembler.load_user_md()
         assert "USER PREFS" in content
 
+    def test_unchanged_user_md_not_resanitized(self, assembler, defaults_dir):
+        """load_user_md runs every turn; identical content reuses the sanitized text."""
+        with patch("tank_backend.prompts.assembler.sanitize", wraps=sanitize) as spy:
+            first = assembler.load_user_md()
+            assert assembler.load_user_md() == first
+            assert spy.call_count == 1
+
+            # Different length, so the mtime+size file cache sees the change
+            (defaults_dir / "USER.md").write_text("USER PREFS:\n- lang: zh-CN")
+            assert "lang: zh" in assembler.load_user_md()
+            assert spy.call_count == 2
+
     def test_platform_placeholders_filled(self, assembler):
         prompt = assembler.assemble()
         assert "{os_label}" not in prompt
@@ -0,0 +1,89 @@
+"""Tests for SentenceChunker — pure string logic, no mocks needed."""
+
+from __future__ import annotations
+
+from tank_backend.pipeline.processors.sentence_chunker import SentenceChunker
+
+
+class TestSentenceBreaks:
+    def test_holds_incomplete_sentence(self):
+        chunker = SentenceChunker()
+        assert chunker.feed("Hello there") == ""
+        assert chunker.flush() == "Hello there"
+
+    def test_releases_on_terminator_followed_by_space(self):
+        chunker = SentenceChunker()
+        assert chunker.feed("Hello there.") == ""
+        assert chunker.feed(" How are") == "Hello there."
+        assert chunker.feed(" you? I") == "How are you?"
+        assert chunker.flush() == "I"
+
+    def test_cjk_terminator_releases_immediately(self):
+        chunker = SentenceChunker()
+        assert chunker.feed("今天天气很好。明") == "今天天气很好。"
+        assert chunker.flush() == "明"
+
+    def test_newline_is_a_break(self):
+        chunker = SentenceChunker()
+        assert chunker.feed("First line\nSecond") == "First line"
+
+    def test_releases_multiple_sentences_at_once(self):
+        chunker = SentenceChunker()
+        assert chunker.feed("One. Two! Three") == "One. Two!"
+
+    def test_flush_clears_buffer(self):
+        chunker = SentenceChunker()
+        chunker.feed("partial")
+        assert chunker.flush() == "partial"
+        assert chunker.flush() == ""
+
+
+class TestNoFalseBreaks:
+    def test_decimal_and_domain(self):
+        chunker = SentenceChunker()
+        assert chunker.feed("Pi is 3.14 on example.com") == ""
+
+    def test_list_marker(self):
+        chunker = SentenceChunker()
+        assert chunker.feed("1. First item") == ""
+
+    def test_inside_markdown_link(self):
+        chunker = SentenceChunker()
+        assert chunker.feed("See [the docs. Really](https://x.io/a. b) now") == ""
+
+    def test_inside_code_fence(self):
+        chunker = SentenceChunker()
+        assert chunker.feed("```\nx = 1. y\nz\n") == ""
+        assert chunker.feed("```\nDone") == "```\nx = 1. y\nz\n```"
+
+
+class TestIncrementalScan:
+    def test_token_by_token_matches_single_feed(self):
+        text = "See [the docs. Really](x.io) now. ```\ncode. y\n```\nDone. Pi is 3.14 today! End"
+        whole = SentenceChunker()
+        expected = [whole.feed(text), whole.flush()]
+
+        chunker = SentenceChunker()
+        released = [chunker.feed(c) for c in text]
+        released.append(chunker.flush())
+
+        # Same text is spoken, only the sentence boundaries may differ
+        assert " ".join(released).split() == " ".join(expected).split()
+        assert released[-1] == "End"
+
+    def test_fence_split_across_tokens(self):
+        chunker = SentenceChunker()
+        assert chunker.feed("``") == ""
+        assert chunker.feed("`\nx. y\n`") == ""
+        assert chunker.feed("``\nDone") == "```\nx. y\n```"
+
+    def test_terminator_at_end_of_token_waits_for_next(self):
+        chunker = SentenceChunker()
+        assert chunker.feed("Hello.") == ""
+        assert chunker.feed(" Next") == "Hello."
+
+    def test_unmatched_bracket_stops_holding_breaks(self):
+        chunker = SentenceChunker()
+        assert chunker.feed("Note (this never closes. ") == ""
+        filler = "word " * 50
+        assert chunker.feed(filler + "End. More") == f"Note (this never closes. {filler}End."
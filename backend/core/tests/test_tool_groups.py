@@ -243,6 +243,25 @@ def test_tool_manager_register_tool():
     assert "custom" in tm.tools
 
 
+def test_openai_tools_reused_until_tool_reregistered():
+    cfg = _make_app_config()
+    tm = ToolManager(app_config=cfg)
+    tm.register_tool(_StubTool("custom"))
+
+    first = tm.get_openai_tools()
+    with patch.object(_StubTool, "get_info", side_effect=AssertionError("rebuilt")):
+        second = tm.get_openai_tools(exclude={"custom"})
+    assert [s["function"]["name"] for s in second] == [
+        s["function"]["name"] for s in first if s["function"]["name"] != "custom"
+    ]
+    assert all(a is b for a, b in zip(first, tm.get_openai_tools(), strict=True))
+
+    replacement = _StubTool("custom")
+    tm.register_tool(replacement)
+    schema = next(s for s in tm.get_openai_tools() if s["function"]["name"] == "custom")
+    assert schema is not next(s for s in first if s["function"]["name"] == "custom")
+
+
 @pytest.mark.asyncio
 async def test_tool_manager_cleanup_delegates():
     cfg = _make_app_config()
@@ -1,5 +1,7 @@
 """Tests for SileroVAD voice activity detection."""
 
+from unittest.mock import MagicMock
+
 import numpy as np
 import pytest
 
@@ -170,6 +172,39 @@ class TestVADChunkBuffering:
         assert all(r.status in valid_statuses for r in results)
 
 
+class TestVADSilenceFastPath:
+    """Chunks below the silence floor skip Silero inference while idle."""
+
+    def test_silent_chunks_skip_model_when_idle(self):
+        vad = SileroVAD(cfg=SegmenterConfig(), sample_rate=16000)
+        vad._vad_iterator = MagicMock(triggered=False)
+
+        for i in range(5):
+            result = vad.process_frame(pcm=generate_silence_frame(), timestamp_s=1000.0 + i * 0.02)
+            assert result.status == VADStatus.NO_SPEECH
+
+        vad._vad_iterator.assert_not_called()
+
+    def test_silent_chunks_reach_model_once_triggered(self):
+        vad = SileroVAD(cfg=SegmenterConfig(), sample_rate=16000)
+        vad._vad_iterator = MagicMock(triggered=True, return_value=None)
+
+        for i in range(5):
+            vad.process_frame(pcm=generate_silence_frame(), timestamp_s=1000.0 + i * 0.02)
+
+        # 5 x 320 samples fill three 512-sample chunks
+        assert vad._vad_iterator.call_count == 3
+
+    def test_speech_chunks_reach_model_when_idle(self):
+        vad = SileroVAD(cfg=SegmenterConfig(), sample_rate=16000)
+        vad._vad_iterator = MagicMock(triggered=False, return_value=None)
+
+        for i in range(2):
+            vad.process_frame(pcm=generate_speech_frame(), timestamp_s=1000.0 + i * 0.02)
+
+        vad._vad_iterator.assert_called_once()
+
+
 class TestVADPreRoll:
     """Test pre-roll mechanism."""
 
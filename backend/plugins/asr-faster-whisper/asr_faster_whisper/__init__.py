@@ -10,10 +10,15 @@ def create_engine(config: dict) -> FasterWhisperASREngine:
         config: Plugin configuration dict with keys:
             - model_size: Whisper model size (default: base)
             - device: cpu or cuda (default: cpu)
-            - compute_type: int8 / float16 / etc. (default: int8)
+            - compute_type: int8 / int8_float16 / float16 / etc. (default:
+              int8 on cpu, int8_float16 on cuda)
+            - cpu_threads: CTranslate2 intra-op threads on CPU; 0 keeps the
+              library default (default: 0)
             - language: ISO code, or "" for auto-detect (default: "")
             - beam_size: decoding beam size (default: 5)
             - sample_rate: Audio sample rate (default: 16000)
+            - warmup: Decode a silent clip in the background after loading
+              so the first utterance is not slowed (default: true)
 
     Returns:
         FasterWhisperASREngine instance
@@ -21,10 +26,12 @@ def create_engine(config: dict) -> FasterWhisperASREngine:
     return FasterWhisperASREngine(
         model_size=config.get("model_size", "base"),
         device=config.get("device", "cpu"),
-        compute_type=config.get("compute_type", "int8"),
+        compute_type=config.get("compute_type", ""),
+        cpu_threads=config.get("cpu_threads", 0),
         language=config.get("language", ""),
         beam_size=config.get("beam_size", 5),
         sample_rate=config.get("sample_rate", 16000),
+        warmup=config.get("warmup", True),
     )
 
 
@@ -12,6 +12,7 @@ The model is loaded once at the engine level and shared across streams.
 from __future__ import annotations
 
 import logging
+import threading
 
 import numpy as np
 from faster_whisper import WhisperModel
@@ -20,6 +21,15 @@ from tank_contracts import ASREngine, ASRStream
 logger = logging.getLogger("FasterWhisperASR")
 
 
+def _default_compute_type(device: str) -> str:
+    """Quantized CTranslate2 compute type for *device*.
+
+    int8 weights cut model memory ~4x and speed up decoding on CPU; on CUDA,
+    int8_float16 keeps activations in fp16 for the tensor cores.
+    """
+    return "int8_float16" if device.startswith("cuda") else "int8"
+
+
 class FasterWhisperASRStream(ASRStream):
     """Per-utterance batch recognition session.
 
@@ -74,24 +84,33 @@ class FasterWhisperASREngine(ASREngine):
         self,
         model_size: str = "base",
         device: str = "cpu",
-        compute_type: str = "int8",
+        compute_type: str = "",
+        cpu_threads: int = 0,
         language: str = "",
         beam_size: int = 5,
         sample_rate: int = 16000,
+        warmup: bool = True,
     ) -> None:
         self._language = language or None
         self._beam_size = beam_size
         self._sample_rate = sample_rate
+        compute_type = compute_type or _default_compute_type(device)
 
         logger.info(
-            "Loading Faster-Whisper model: size=%s device=%s compute_type=%s",
-            model_size, device, compute_type,
+            "Loading Faster-Whisper model: size=%s device=%s compute_type=%s cpu_threads=%s",
+            model_size, device, compute_type, cpu_threads or "default",
         )
+        # 0 leaves CTranslate2 on its default (OMP_NUM_THREADS, else 4).
         self._model = WhisperModel(
-            model_size, device=device, compute_type=compute_type
+            model_size, device=device, compute_type=compute_type, cpu_threads=cpu_threads,
         )
         logger.info("Faster-Whisper model loaded")
 
+        if warmup:
+            threading.Thread(
+                target=self._warmup, name="FasterWhisperWarmup", daemon=True,
+            ).start()
+
     # ------------------------------------------------------------------
     # ASREngine contract
     # ------------------------------------------------------------------
@@ -110,6 +129,21 @@ class FasterWhisperASREngine(ASREngine):
     # Transcription (called by the per-stream wrapper)
     # ------------------------------------------------------------------
 
+    def _warmup(self) -> None:
+        """Decode a short silent clip so the first real utterance skips
+        CTranslate2's one-time allocation and feature-extractor setup."""
+        try:
+            segments, _info = self._model.transcribe(
+                np.zeros(self._sample_rate // 2, dtype=np.float32),
+                language=self._language,
+                beam_size=1,
+            )
+            for _ in segments:  # segments are lazy; decoding runs on iteration
+                pass
+            logger.info("Faster-Whisper warmup done")
+        except Exception:
+            logger.warning("Faster-Whisper warmup failed", exc_info=True)
+
     def transcribe(self, audio: np.ndarray) -> tuple[str, str | None]:
         """Transcribe a complete float32 mono utterance.
 
@@ -1,5 +1,6 @@
 """Test Faster-Whisper ASR plugin."""
 
+import threading
 from unittest.mock import MagicMock, patch
 
 import numpy as np
@@ -9,7 +10,10 @@ MODULE = "asr_faster_whisper.engine"
 
 def _make_engine(**overrides):
     """Create an engine with WhisperModel patched (no model download)."""
-    config = {"model_size": "base", "device": "cpu", "compute_type": "int8", **overrides}
+    config = {
+        "model_size": "base", "device": "cpu", "compute_type": "int8", "warmup": False,
+        **overrides,
+    }
     with patch(f"{MODULE}.WhisperModel") as mock_model_cls:
         from asr_faster_whisper import create_engine
 
@@ -28,20 +32,34 @@ def test_create_engine_factory():
             "model_size": "large-v3",
             "device": "cuda",
             "compute_type": "float16",
+            "cpu_threads": 2,
             "language": "en",
             "beam_size": 3,
             "sample_rate": 8000,
+            "warmup": False,
         })
         mock_init.assert_called_once_with(
             model_size="large-v3",
             device="cuda",
             compute_type="float16",
+            cpu_threads=2,
             language="en",
             beam_size=3,
             sample_rate=8000,
+            warmup=False,
         )
 
 
+def test_compute_type_defaults_to_int8_per_device():
+    """Unset compute_type loads quantized weights suited to the device."""
+    for device, expected in (("cpu", "int8"), ("cuda", "int8_float16")):
+        with patch(f"{MODULE}.WhisperModel") as mock_model_cls:
+            from asr_faster_whisper import create_engine
+
+            create_engine({"device": device, "warmup": False})
+        assert mock_model_cls.call_args.kwargs["compute_type"] == expected
+
+
 def test_supports_streaming_is_false():
     """Faster-Whisper is a batch engine, not streaming."""
     engine, _ = _make_engine()
@@ -92,3 +110,32 @@ def test_stop_without_audio_returns_empty():
     stream.start()
     assert stream.stop() == ""
     mock_model.transcribe.assert_not_called()
+
+
+def test_warmup_decodes_silence_in_background():
+    """Warmup runs one short silent decode off the constructor thread."""
+    decoded = threading.Event()
+
+    def _segments():
+        decoded.set()
+        return iter(())
+
+    with patch(f"{MODULE}.WhisperModel") as mock_model_cls:
+        mock_model = mock_model_cls.return_value
+        mock_model.transcribe.side_effect = lambda *a, **k: (_segments(), MagicMock())
+        from asr_faster_whisper import create_engine
+
+        create_engine({"sample_rate": 16000})
+        assert decoded.wait(timeout=2)
+
+    audio = mock_model.transcribe.call_args.args[0]
+    assert audio.shape == (8000,)
+    assert not audio.any()
+
+
+def test_cpu_threads_passed_to_model():
+    with patch(f"{MODULE}.WhisperModel") as mock_model_cls:
+        from asr_faster_whisper import create_engine
+
+        create_engine({"cpu_threads": 2, "warmup": False})
+    assert mock_model_cls.call_args.kwargs["cpu_threads"] == 2
@@ -11,6 +11,8 @@ def create_engine(config: dict) -> SherpaASREngine:
             - model_dir: Path to Sherpa-ONNX model directory
             - num_threads: Number of threads (default: 4)
             - sample_rate: Audio sample rate (default: 16000)
+            - warmup: Decode a silent clip in the background after loading
+              so the first utterance is not slowed (default: true)
 
     Returns:
         SherpaASREngine instance
@@ -19,6 +21,7 @@ def create_engine(config: dict) -> SherpaASREngine:
         model_dir=config.get("model_dir", "../models/sherpa-onnx-zipformer-en-zh"),
         num_threads=config.get("num_threads", 4),
         sample_rate=config.get("sample_rate", 16000),
+        warmup=config.get("warmup", True),
     )
 
 
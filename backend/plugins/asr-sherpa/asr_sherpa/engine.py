@@ -13,16 +13,21 @@ from __future__ import annotations
 import ctypes
 import logging
 import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import Any
 
+import numpy as np
 from tank_contracts import ASREngine, ASRStream
 
-if TYPE_CHECKING:
-    import numpy as np
-
 logger = logging.getLogger("SherpaASREngine")
 
+# Audio is handed to sherpa in batches of this length rather than per
+# 20 ms frame. The zipformer decodes in chunks of roughly this size anyway,
+# so partial transcripts lose no granularity while pybind11 crossings drop ~16x.
+_FEED_BATCH_S = 0.32
+
 
 def _patch_macos_onnxruntime() -> None:
     """Pre-load onnxruntime dylib on macOS to avoid sherpa-onnx load failures."""
@@ -70,14 +75,19 @@ class SherpaASRStream(ASRStream):
     """Per-utterance sherpa-onnx recognition session.
 
     Holds a fresh sherpa stream (from ``recognizer.create_stream()``) and
-    tracks session state. The underlying model lives on the engine.
+    tracks session state. The underlying model lives on the engine. The
+    stream for the next utterance is built on the engine's worker thread
+    while the current one is idle, so ``start()`` only picks it up.
     """
 
     def __init__(self, engine: SherpaASREngine) -> None:
         self._engine = engine
         self._recognizer = engine._recognizer
-        self._stream = self._recognizer.create_stream()
+        self._stream: Any = None
+        self._next_stream: Future | None = engine._prepare_stream()
         self._sample_rate = engine._sample_rate
+        self._batch = np.empty(int(self._sample_rate * _FEED_BATCH_S), dtype=np.float32)
+        self._batch_len = 0
         self._session_active = False
         self._last_text = ""
 
@@ -88,9 +98,14 @@ class SherpaASRStream(ASRStream):
         prior utterance called input_finished(), the stream's decoder state
         can't be fully cleared by reset() — trailing tokens from the previous
         utterance survive and bleed into this one. A new stream guarantees
-        zero carryover.
+        zero carryover; it was normally prepared when the previous session
+        stopped.
         """
-        self._stream = self._recognizer.create_stream()
+        pending, self._next_stream = self._next_stream, None
+        self._stream = (
+            pending.result() if pending is not None else self._recognizer.create_stream()
+        )
+        self._batch_len = 0
         self._session_active = True
         self._last_text = ""
         logger.debug("Sherpa: Session started")
@@ -98,6 +113,9 @@ class SherpaASRStream(ASRStream):
     def process_pcm(self, pcm: np.ndarray) -> str:
         """Process a chunk of PCM audio.
 
+        Audio is buffered until a full feed batch is available; until then
+        the previous partial is returned unchanged.
+
         Returns:
             Current partial transcript text.
         """
@@ -105,7 +123,20 @@ class SherpaASRStream(ASRStream):
             logger.warning("Sherpa: process_pcm called without active session")
             return ""
 
-        self._stream.accept_waveform(self._sample_rate, pcm)
+        # Top the batch up to capacity and feed it in one crossing; the rest
+        # of the frame carries over into the next batch
+        fed = False
+        offset, n = 0, len(pcm)
+        while offset < n:
+            take = min(n - offset, self._batch.size - self._batch_len)
+            self._batch[self._batch_len : self._batch_len + take] = pcm[offset : offset + take]
+            self._batch_len += take
+            offset += take
+            if self._batch_len == self._batch.size:
+                self._flush_batch()
+                fed = True
+        if not fed:
+            return self._last_text
 
         while self._recognizer.is_ready(self._stream):
             self._recognizer.decode_stream(self._stream)
@@ -115,7 +146,13 @@ class SherpaASRStream(ASRStream):
         if text:
             self._last_text = text
 
-        return text
+        return self._last_text
+
+    def _flush_batch(self) -> None:
+        """Feed any buffered audio to the sherpa stream."""
+        if self._batch_len:
+            self._stream.accept_waveform(self._sample_rate, self._batch[: self._batch_len])
+            self._batch_len = 0
 
     def stop(self) -> str:
         """Stop the session and return final transcript.
@@ -135,7 +172,7 @@ class SherpaASRStream(ASRStream):
 
         # Pad with a short tail of silence, mark input finished, and drain the
         # decoder so trailing tokens are flushed before we read the result.
-        import numpy as np
+        self._flush_batch()
         tail_silence = np.zeros(int(self._sample_rate * 0.3), dtype=np.float32)
         self._stream.accept_waveform(self._sample_rate, tail_silence)
         self._stream.input_finished()
@@ -145,9 +182,11 @@ class SherpaASRStream(ASRStream):
         text = self._recognizer.get_result(self._stream).text.strip()
         final_text = text or self._last_text
 
-        # No reset() here — start() creates a fresh stream for the next
-        # utterance, so this (now input-finished) stream is simply discarded.
+        # No reset() here — the next utterance gets a fresh stream, so this
+        # (now input-finished) stream is simply discarded. Build that stream
+        # in the background now, off the speech-start path.
         self._last_text = ""
+        self._next_stream = self._engine._prepare_stream()
 
         logger.debug(
             "Sherpa: Session stopped, final text: %s",
@@ -171,6 +210,7 @@ class SherpaASREngine(ASREngine):
         model_dir: str,
         num_threads: int = 4,
         sample_rate: int = 16000,
+        warmup: bool = True,
     ):
         (
             EndpointConfig, EndpointRule, FeatureExtractorConfig,
@@ -218,17 +258,45 @@ class SherpaASREngine(ASREngine):
 
         self._recognizer = OnlineRecognizer(recognizer_config)
         self._sample_rate = sample_rate
+        self._stream_worker = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="SherpaStream",
+        )
         logger.info("SherpaASREngine initialized with model from %s", model_dir)
 
+        if warmup:
+            threading.Thread(
+                target=self._warmup, name="SherpaWarmup", daemon=True,
+            ).start()
+
     def create_stream(self) -> ASRStream:
         """Create a fresh per-utterance recognition stream."""
         return SherpaASRStream(self)
 
+    def _prepare_stream(self) -> Future:
+        """Build a sherpa stream on the background worker."""
+        return self._stream_worker.submit(self._recognizer.create_stream)
+
     @property
     def sample_rate(self) -> int:
         """The sample rate this engine's model was configured for."""
         return self._sample_rate
 
+    def _warmup(self) -> None:
+        """Decode a short silent clip so the first real utterance skips
+        onnxruntime's one-time graph setup and allocator growth."""
+        try:
+            stream = self._recognizer.create_stream()
+            stream.accept_waveform(
+                self._sample_rate, np.zeros(self._sample_rate // 2, dtype=np.float32),
+            )
+            stream.input_finished()
+            while self._recognizer.is_ready(stream):
+                self._recognizer.decode_stream(stream)
+            logger.info("Sherpa warmup done")
+        except Exception:
+            logger.warning("Sherpa warmup failed", exc_info=True)
+
     def close(self) -> None:
-        """Release engine-level resources (no-op for local model)."""
+        """Release engine-level resources (the stream worker)."""
+        self._stream_worker.shutdown(wait=False, cancel_futures=True)
         logger.info("Sherpa: Engine closed")
@@ -1,5 +1,6 @@
 """Tests for Sherpa-ONNX ASR engine."""
 
+import threading
 from unittest.mock import MagicMock, patch
 
 import numpy as np
@@ -97,10 +98,136 @@ def test_create_engine_factory():
             "model_dir": "/my/model",
             "num_threads": 2,
             "sample_rate": 8000,
+            "warmup": False,
         })
 
         mock_init.assert_called_once_with(
             model_dir="/my/model",
             num_threads=2,
             sample_rate=8000,
+            warmup=False,
         )
+
+
+def _make_engine(mock_recognizer, warmup=False):
+    """Build a SherpaASREngine around *mock_recognizer* without sherpa-onnx."""
+    classes = [MagicMock() for _ in range(9)]
+    classes[6].return_value = mock_recognizer  # OnlineRecognizer
+    with (
+        patch(f"{MODULE}._load_sherpa", return_value=tuple(classes)),
+        patch(f"{MODULE}.Path") as mock_path_cls,
+    ):
+        mock_path_cls.return_value.exists.return_value = True
+        from asr_sherpa.engine import SherpaASREngine
+
+        return SherpaASREngine(model_dir="/fake/model", warmup=warmup)
+
+
+def test_next_session_stream_is_prepared_on_stop():
+    """stop() builds the next stream in the background; start() picks it up."""
+    mock_recognizer = MagicMock()
+    streams = [MagicMock(name=f"stream{i}") for i in range(3)]
+    mock_recognizer.create_stream.side_effect = streams
+    mock_recognizer.is_ready.return_value = False
+    mock_recognizer.get_result.return_value = MagicMock(text="hi")
+    engine = _make_engine(mock_recognizer)
+
+    stream = engine.create_stream()
+    stream.start()
+    assert stream._stream is streams[0]
+    stream.process_pcm(np.zeros(320, dtype=np.float32))
+    assert stream.stop() == "hi"
+
+    # The replacement was created off-thread before the next start()
+    stream._next_stream.result(timeout=1)
+    assert mock_recognizer.create_stream.call_count == 2
+    stream.start()
+    assert stream._stream is streams[1]
+    assert mock_recognizer.create_stream.call_count == 2
+    engine.close()
+
+
+def _start_recording_stream(engine):
+    """Start a session; returns it and the copies of every fed waveform."""
+    stream = engine.create_stream()
+    stream.start()
+    fed: list[np.ndarray] = []
+    # The batch buffer is reused, so record copies rather than views
+    stream._stream.accept_waveform.side_effect = lambda sr, a: fed.append(a.copy())
+    return stream, fed
+
+
+def test_frames_are_fed_to_sherpa_in_batches():
+    """20 ms frames are coalesced; stop() feeds whatever is still buffered."""
+    mock_recognizer = MagicMock()
+    mock_recognizer.is_ready.return_value = False
+    mock_recognizer.get_result.return_value = MagicMock(text="")
+    engine = _make_engine(mock_recognizer)
+    stream, fed = _start_recording_stream(engine)
+
+    for i in range(20):
+        stream.process_pcm(np.full(320, i, dtype=np.float32))
+
+    # 0.32 s batch = 5120 samples = 16 frames, fed in a single call
+    assert [len(a) for a in fed] == [5120]
+
+    stream.stop()
+    # Remaining 4 frames, then the tail silence
+    assert len(fed[1]) == 1280
+    assert fed[1][0] == 16
+    engine.close()
+
+
+def test_frame_overflowing_the_batch_carries_over():
+    """A frame that crosses the batch boundary is split, never fed on its own."""
+    mock_recognizer = MagicMock()
+    mock_recognizer.is_ready.return_value = False
+    mock_recognizer.get_result.return_value = MagicMock(text="")
+    engine = _make_engine(mock_recognizer)
+    stream, fed = _start_recording_stream(engine)
+
+    pcm = np.arange(11 * 500, dtype=np.float32)
+    for i in range(11):
+        stream.process_pcm(pcm[i * 500 : (i + 1) * 500])
+
+    assert [len(a) for a in fed] == [5120]
+    np.testing.assert_array_equal(fed[0], pcm[:5120])
+    assert stream._batch_len == 380
+    np.testing.assert_array_equal(stream._batch[:380], pcm[5120:])
+
+    # An oversized chunk fills whole batches and carries its tail too
+    stream.process_pcm(np.ones(2 * 5120, dtype=np.float32))
+    assert [len(a) for a in fed] == [5120, 5120, 5120]
+    assert stream._batch_len == 380
+    engine.close()
+
+
+def test_feed_keeps_last_partial_when_decoder_has_no_text():
+    mock_recognizer = MagicMock()
+    mock_recognizer.is_ready.return_value = False
+    mock_recognizer.get_result.side_effect = [MagicMock(text="hello"), MagicMock(text="")]
+    engine = _make_engine(mock_recognizer)
+    stream, _ = _start_recording_stream(engine)
+    frame = np.zeros(5120, dtype=np.float32)
+
+    assert stream.process_pcm(frame) == "hello"
+    assert stream.process_pcm(frame) == "hello"
+    engine.close()
+
+
+def test_warmup_decodes_silence_in_background():
+    """Warmup feeds half a second of silence through a throwaway stream."""
+    decoded = threading.Event()
+    mock_recognizer = MagicMock()
+    mock_recognizer.is_ready.side_effect = [True, False]
+    mock_recognizer.decode_stream.side_effect = lambda s: decoded.set()
+
+    engine = _make_engine(mock_recognizer, warmup=True)
+    assert decoded.wait(timeout=2)
+
+    warm_stream = mock_recognizer.decode_stream.call_args.args[0]
+    audio = warm_stream.accept_waveform.call_args.args[1]
+    assert audio.shape == (8000,)
+    assert not audio.any()
+    warm_stream.input_finished.assert_called_once()
+    engine.close()
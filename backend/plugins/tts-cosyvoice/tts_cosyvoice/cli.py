@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import re
 import sys
 
 import numpy as np
@@ -11,6 +12,8 @@ import sounddevice as sd
 
 from .engine import COSYVOICE_SAMPLE_RATE, CosyVoiceTTSEngine
 
+_CJK_RE = re.compile("[\u4e00-\u9fff]")
+
 
 async def _speak(engine: CosyVoiceTTSEngine, text: str, language: str, voice: str | None = None) -> None:
     pcm = bytearray()
@@ -44,7 +47,7 @@ def main() -> None:
     language = args.lang
     if language == "auto":
         # Simple heuristic: if any CJK character, assume Chinese
-        language = "zh" if any("\u4e00" <= c <= "\u9fff" for c in args.text) else "en"
+        language = "zh" if _CJK_RE.search(args.text) else "en"
 
     asyncio.run(_speak(engine, args.text, language, voice=args.spk), debug=False)
 
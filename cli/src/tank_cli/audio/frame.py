@@ -22,11 +22,15 @@ def encode_audio_frame(pcm: bytes, sample_rate: int, channels: int) -> bytes:
     return AUDIO_FRAME_HEADER_STRUCT.pack(AUDIO_FRAME_MAGIC, sample_rate, channels) + pcm
 
 
-def decode_audio_frame(frame: bytes) -> tuple[bytes, int, int]:
-    """Parse a framed audio buffer. Returns (pcm, sample_rate, channels)."""
+def decode_audio_frame(frame: bytes) -> tuple[memoryview, int, int]:
+    """Parse a framed audio buffer. Returns (pcm, sample_rate, channels).
+
+    ``pcm`` is a zero-copy view into ``frame``; slicing ``bytes`` directly
+    would copy every TTS chunk a second time after the WebSocket read.
+    """
     if len(frame) < AUDIO_FRAME_HEADER_SIZE:
         raise ValueError(f"frame too short: {len(frame)} < {AUDIO_FRAME_HEADER_SIZE}")
     magic, sample_rate, channels = AUDIO_FRAME_HEADER_STRUCT.unpack_from(frame, 0)
     if magic != AUDIO_FRAME_MAGIC:
         raise ValueError(f"bad audio frame magic: 0x{magic:04x}")
-    return frame[AUDIO_FRAME_HEADER_SIZE:], sample_rate, channels
+    return memoryview(frame)[AUDIO_FRAME_HEADER_SIZE:], sample_rate, channels
@@ -1,5 +1,5 @@
 """Audio input module."""
 
-from .types import AudioFormat, AudioFrame, FrameConfig
+from .types import AudioFormat, FrameConfig
 
-__all__ = ["AudioFrame", "AudioFormat", "FrameConfig"]
+__all__ = ["AudioFormat", "FrameConfig"]
@@ -3,15 +3,15 @@
 from __future__ import annotations
 
 import logging
-import queue
 import threading
-import time
+from collections.abc import Callable
 
 import numpy as np
 import sounddevice as sd
 
 from ...core import StopSignal
-from .types import AudioFormat, AudioFrame, FrameConfig
+from .ring import PcmRing
+from .types import AudioFormat, FrameConfig
 
 logger = logging.getLogger("Mic")
 
@@ -25,7 +25,7 @@ DTYPE_MAP = {
 
 class Mic(threading.Thread):
     """
-    Continuously captures microphone audio and pushes AudioFrame into frames_queue.
+    Continuously captures microphone audio and writes the samples into a PcmRing.
 
     Important: keep callback/lightweight; no VAD/ASR here.
     """
@@ -35,19 +35,23 @@ class Mic(threading.Thread):
         stop_signal: StopSignal,
         audio_format: AudioFormat,
         frame_cfg: FrameConfig,
-        frames_queue: queue.Queue[AudioFrame],
+        ring: PcmRing,
         device: int | None = None,
+        on_audio: Callable[[], None] | None = None,
     ):
         super().__init__(name="MicThread", daemon=True)
         self._stop_signal = stop_signal
         self._audio_format = audio_format
         self._frame_cfg = frame_cfg
-        self._frames_queue = frames_queue
+        self._ring = ring
         self._device = device
+        self._on_audio = on_audio
+        # Frames dropped in the current overrun; logged once per episode
+        self._overrun_frames = 0
 
     def run(self) -> None:
         """Start microphone capture loop."""
-        blocksize = int(self._audio_format.sample_rate * self._frame_cfg.frame_ms / 1000)
+        blocksize = self._frame_cfg.samples_per_frame(self._audio_format.sample_rate)
         dtype = DTYPE_MAP.get(self._audio_format.dtype, np.float32)
 
         def audio_callback(indata, frames, time_info, status):
@@ -55,17 +59,20 @@ class Mic(threading.Thread):
             if status:
                 logger.warning(f"Audio callback status: {status}")
 
-            # Convert to float32: indata shape is (frames, channels)
-            pcm = indata[:, 0].astype(np.float32) if indata.ndim > 1 else indata.astype(np.float32)
-
-            frame = AudioFrame(
-                pcm=pcm, sample_rate=self._audio_format.sample_rate, timestamp_s=time.time()
-            )
-
-            try:
-                self._frames_queue.put_nowait(frame)
-            except queue.Full:
-                logger.warning("Frames queue is full, dropping audio frame")
+            # InputStream always delivers (frames, channels); keep the first
+            # channel as a view, the ring converts to int16 as it copies
+            if not self._ring.write(indata[:, 0]):
+                if self._overrun_frames == 0:
+                    logger.warning("Capture ring is full, dropping audio frames")
+                self._overrun_frames += 1
+                return
+            if self._overrun_frames:
+                logger.warning(
+                    "Capture ring recovered after dropping %d frames", self._overrun_frames
+                )
+                self._overrun_frames = 0
+            if self._on_audio is not None:
+                self._on_audio()
 
         try:
             with sd.InputStream(
@@ -75,9 +82,10 @@ class Mic(threading.Thread):
                 blocksize=blocksize,
                 dtype=dtype,
                 device=self._device,
-            ):
-                while not self._stop_signal.is_set():
-                    time.sleep(0.1)
+                latency="low",
+            ) as stream:
+                logger.info("Microphone input latency: %.1f ms", stream.latency * 1000)
+                self._stop_signal.wait()
         except Exception as e:
             logger.error(f"Error in microphone capture: {e}", exc_info=True)
         finally:
@@ -0,0 +1,78 @@
+"""Single-producer/single-consumer ring buffer for captured PCM."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from ..pcm import empty_aligned, float_to_int16
+
+
+class PcmRing:
+    """Fixed-capacity circular buffer of mono int16 samples.
+
+    Sits between the Mic callback thread (the only writer) and the capture
+    drain loop (the only reader). Each side owns one cursor, so neither takes
+    a lock: the writer fills the slots before advancing ``_write``, and the
+    reader only advances ``_read`` once it is done with the view it was given.
+    Cursors count samples ever written/read and are reduced modulo capacity
+    on access.
+    """
+
+    def __init__(self, capacity: int):
+        self._buf = empty_aligned(capacity, np.int16)
+        # Float intermediate for the int16 conversion, so writes from the
+        # audio callback never allocate
+        self._scratch = empty_aligned(capacity, np.float32)
+        self._capacity = capacity
+        self._write = 0
+        self._read = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def __len__(self) -> int:
+        """Number of unread samples."""
+        return self._write - self._read
+
+    def write(self, pcm: np.ndarray) -> bool:
+        """Append ``pcm`` (float in [-1.0, 1.0] or integer), stored as int16.
+
+        All-or-nothing: returns ``False`` without writing if the ring lacks
+        room for the whole block, so frames are never split by an overrun.
+        """
+        n = pcm.shape[0]
+        if n > self._capacity - len(self):
+            return False
+        start = self._write % self._capacity
+        first = min(n, self._capacity - start)
+        _store(self._buf[start : start + first], pcm[:first], self._scratch)
+        if first < n:
+            _store(self._buf[: n - first], pcm[first:], self._scratch)
+        self._write += n
+        return True
+
+    def peek(self, max_samples: int) -> np.ndarray:
+        """Return a view of up to ``max_samples`` unread samples.
+
+        The view stops at the end of the backing array, so a backlog that
+        wraps around is returned over two calls. Call ``consume`` once the
+        view is no longer needed.
+        """
+        start = self._read % self._capacity
+        n = min(max_samples, len(self), self._capacity - start)
+        return self._buf[start : start + n]
+
+    def consume(self, n: int) -> None:
+        """Release ``n`` samples previously returned by ``peek``."""
+        self._read += n
+
+
+def _store(dst: np.ndarray, src: np.ndarray, scratch: np.ndarray) -> None:
+    if src.dtype.kind == "f":
+        float_to_int16(src, out=dst, scratch=scratch[: src.shape[0]])
+    elif src.dtype.itemsize > 2:
+        # Wider integer PCM (e.g. int32): keep the top 16 bits
+        np.copyto(dst, src >> (8 * src.dtype.itemsize - 16), casting="unsafe")
+    else:
+        np.copyto(dst, src)
@@ -2,39 +2,7 @@
 
 from __future__ import annotations
 
-import queue
-from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Protocol, runtime_checkable
-
-import numpy as np
-
-from ...core import StopSignal
-
-
-@dataclass
-class AudioFrame:
-    """Single audio frame from microphone or other source."""
-
-    pcm: np.ndarray  # shape: (n_samples,) float32
-    sample_rate: int
-    timestamp_s: float
-
-
-@runtime_checkable
-class AudioSource(Protocol):
-    """Protocol for audio input sources."""
-
-    def start(self) -> None:
-        """Start capturing audio."""
-        ...
-
-    def join(self) -> None:
-        """Wait for the source to stop."""
-        ...
-
-
-AudioSourceFactory = Callable[[queue.Queue["AudioFrame"], StopSignal], AudioSource]
 
 
 @dataclass(frozen=True)
@@ -43,7 +11,9 @@ class AudioFormat:
 
     sample_rate: int = 16000
     channels: int = 1
-    dtype: str = "float32"  # sounddevice dtype name
+    # sounddevice dtype name; int16 matches the ring and the wire format, so
+    # PortAudio does any conversion and the callback is a plain copy
+    dtype: str = "int16"
 
 
 @dataclass(frozen=True)
@@ -53,24 +23,7 @@ class FrameConfig:
     frame_ms: int = 20
     max_frames_queue: int = 400
 
+    def samples_per_frame(self, sample_rate: int) -> int:
+        """Number of samples in one frame at the given sample rate."""
+        return int(sample_rate * self.frame_ms / 1000)
 
-@dataclass(frozen=True)
-class SegmenterConfig:
-    """Utterance segmentation (VAD + endpointing) configuration."""
-
-    speech_threshold: float = 0.5
-    min_speech_ms: int = 200
-    min_silence_ms: int = 1000
-    pre_roll_ms: int = 200
-    max_utterance_ms: int = 20000
-
-
-@dataclass(frozen=True)
-class PerceptionConfig:
-    """Configuration for Perception thread."""
-
-    enable_voiceprint: bool = True
-    voiceprint_timeout_s: float = 0.5
-    default_user: str = "Unknown"
-    model_size: str = "large-v3"
-    sherpa_model_dir: str = "models/sherpa-onnx-zipformer-en-zh"
@@ -0,0 +1,49 @@
+"""Bounded playback queue that drops the oldest audio instead of the newest."""
+
+from __future__ import annotations
+
+import queue
+
+from .types import AudioChunk
+
+
+class ChunkQueue(queue.Queue[AudioChunk | None]):
+    """``queue.Queue`` of AudioChunks and ``None`` end-of-stream markers.
+
+    ``put_latest`` and ``put_end_of_stream`` never block: when the queue is
+    full they evict the oldest AudioChunk in the same critical section as the
+    insert. ``None``
+    markers are never evicted, since losing one would run two replies together
+    in a single output stream.
+    """
+
+    def put_latest(self, chunk: AudioChunk) -> bool:
+        """Enqueue ``chunk``, evicting the oldest chunk if full.
+
+        Returns ``False`` if ``chunk`` itself had to be dropped because the
+        queue holds nothing but end-of-stream markers.
+        """
+        return self._put_evicting(chunk)
+
+    def put_end_of_stream(self) -> bool:
+        """Enqueue a ``None`` marker, evicting the oldest chunk if full.
+
+        Returns ``False`` only if the queue already holds nothing but markers,
+        in which case the stream has ended anyway.
+        """
+        return self._put_evicting(None)
+
+    def _put_evicting(self, item: AudioChunk | None) -> bool:
+        with self.not_full:
+            if 0 < self.maxsize <= self._qsize():
+                for i, queued in enumerate(self.queue):
+                    if queued is not None:
+                        del self.queue[i]
+                        break
+                else:
+                    return False
+            else:
+                self.unfinished_tasks += 1
+            self._put(item)
+            self.not_empty.notify()
+            return True
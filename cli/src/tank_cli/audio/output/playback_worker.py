@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import queue
 import threading
 import time
+from collections import deque
 
 import numpy as np
 import sounddevice as sd
@@ -21,6 +23,25 @@ PLAYBACK_BLOCKSIZE = 256
 # Short fade at start/end to avoid pops (ms). Used for fade-in and fade-out.
 FADE_DURATION_MS = 5
 
+# Unity gain in Q15 fixed point; int16 * _Q15_ONE still fits in int32.
+_Q15_ONE = 1 << 15
+
+
+@functools.lru_cache(maxsize=8)
+def _fade_ramp_q15(n: int, rising: bool) -> np.ndarray:
+    """Read-only linear gain ramp of ``n`` Q15 steps (0 -> unity, or reversed)."""
+    ramp = np.linspace(0, _Q15_ONE, n).astype(np.int32)
+    if not rising:
+        ramp = ramp[::-1].copy()
+    ramp.flags.writeable = False
+    return ramp
+
+
+def _apply_fade(samples: np.ndarray, rising: bool) -> None:
+    """Scale int16 ``samples`` in place by a linear fade, in integer arithmetic."""
+    ramp = _fade_ramp_q15(len(samples), rising)
+    samples[:] = (samples.astype(np.int32) * ramp) >> 15
+
 
 class PlaybackWorker(threading.Thread):
     """
@@ -68,8 +89,10 @@ class PlaybackWorker(threading.Thread):
         first_callback_done = [False]
         callback_count = [0]
         queue_ref = self._audio_chunk_queue
-        buf_container: list[np.ndarray] = [np.frombuffer(first_chunk.data, dtype=np.int16).copy()]
-        initial_samples = len(buf_container[0])
+        # Queued chunks as read-only views; the callback copies straight from
+        # them into outdata and trims the head view, never concatenating.
+        pending: deque[np.ndarray] = deque([np.frombuffer(first_chunk.data, dtype=np.int16)])
+        initial_samples = len(pending[0])
         logger.info(
             "PlaybackWorker: starting stream sr=%s ch=%s blocksize=%s initial_samples=%s",
             sample_rate,
@@ -92,50 +115,49 @@ class PlaybackWorker(threading.Thread):
             if callback_count[0] == 1:
                 logger.info("PlaybackWorker: first callback, frames=%s", frames)
 
+            # Fill PortAudio's buffer in place; it is C-contiguous, so ravel is a view
             need = frames * channels
-            buf = buf_container[0]
-            while len(buf) < need and not stream_ended[0]:
-                try:
-                    item = queue_ref.get_nowait()
+            out_flat = outdata.ravel()
+            have = 0
+            while have < need:
+                if not pending:
+                    if stream_ended[0]:
+                        break
+                    try:
+                        item = queue_ref.get_nowait()
+                    except queue.Empty:
+                        break
                     if item is None:
                         stream_ended[0] = True
                         break
-                    buf = np.concatenate([buf, np.frombuffer(item.data, dtype=np.int16)])
-                except queue.Empty:
-                    break
-            buf_container[0] = buf
-
-            have = min(len(buf), need)
-            out = np.zeros((frames, channels), dtype=np.int16)
-            out_flat = out.ravel()
-            out_flat[:have] = buf[:have]
-            buf_container[0] = buf[have:]
+                    pending.append(np.frombuffer(item.data, dtype=np.int16))
+                    continue
+                head = pending[0]
+                n = min(len(head), need - have)
+                out_flat[have : have + n] = head[:n]
+                have += n
+                if n == len(head):
+                    pending.popleft()
+                else:
+                    pending[0] = head[n:]
+            out_flat[have:] = 0
 
             if not first_callback_done[0]:
                 first_callback_done[0] = True
                 n_apply = min(n_fade, have)
                 if n_apply > 0:
-                    ramp = np.linspace(0.0, 1.0, n_apply, dtype=np.float64)
-                    out_flat[:n_apply] = (out_flat[:n_apply].astype(np.float64) * ramp).astype(
-                        np.int16
-                    )
+                    _apply_fade(out_flat[:n_apply], rising=True)
 
-            if stream_ended[0] and len(buf_container[0]) == 0:
+            if stream_ended[0] and not pending:
                 n_apply = min(n_fade, have)
                 if n_apply > 0:
-                    ramp = np.linspace(1.0, 0.0, n_apply, dtype=np.float64)
-                    out_flat[have - n_apply : have] = (
-                        out_flat[have - n_apply : have].astype(np.float64) * ramp
-                    ).astype(np.int16)
-                outdata[:] = out
+                    _apply_fade(out_flat[have - n_apply : have], rising=False)
                 logger.info(
                     "PlaybackWorker: stream ended after %d callbacks, raising CallbackStop",
                     callback_count[0],
                 )
                 raise sd.CallbackStop
 
-            outdata[:] = out
-
         try:
             logger.info("PlaybackWorker: opening OutputStream")
             with sd.OutputStream(
@@ -5,7 +5,7 @@ from __future__ import annotations
 import queue
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Optional, Protocol, runtime_checkable
+from typing import Protocol, runtime_checkable
 
 from ...core import StopSignal
 
@@ -23,13 +23,13 @@ class AudioSink(Protocol):
         ...
 
 
-AudioSinkFactory = Callable[[queue.Queue[Optional["AudioChunk"]], StopSignal], AudioSink]
-
-
 @dataclass(frozen=True)
 class AudioChunk:
     """One chunk of PCM audio for playback."""
 
-    data: bytes
+    data: bytes | memoryview
     sample_rate: int
     channels: int = 1
+
+
+AudioSinkFactory = Callable[[queue.Queue[AudioChunk | None], StopSignal], AudioSink]
@@ -0,0 +1,43 @@
+"""PCM sample format conversion."""
+
+from __future__ import annotations
+
+import numpy as np
+
+INT16_SCALE = 32768.0
+
+# Byte alignment for reusable conversion buffers (one AVX2 register).
+SIMD_ALIGNMENT = 32
+
+
+def empty_aligned(n: int, dtype: np.dtype | type = np.int16) -> np.ndarray:
+    """Allocate a C-contiguous 1-D array whose data starts on a SIMD_ALIGNMENT boundary.
+
+    ``np.empty`` only guarantees the allocator's default (often 16-byte)
+    alignment, so over-allocate raw bytes and slice from the first aligned offset.
+    """
+    itemsize = np.dtype(dtype).itemsize
+    raw = np.empty(n * itemsize + SIMD_ALIGNMENT, dtype=np.uint8)
+    offset = -raw.ctypes.data % SIMD_ALIGNMENT
+    return raw[offset : offset + n * itemsize].view(dtype)
+
+
+def float_to_int16(
+    pcm: np.ndarray,
+    out: np.ndarray | None = None,
+    scratch: np.ndarray | None = None,
+) -> np.ndarray:
+    """Convert float PCM in [-1.0, 1.0] to int16, saturating out-of-range samples.
+
+    Without clipping, a full-scale ``1.0`` sample scales to 32768 and wraps to
+    -32768 on cast. Pass ``out`` (an int16 array of the same length) to reuse a
+    buffer across calls instead of allocating a new one per frame, and
+    ``scratch`` (a float32 array of the same length) to hold the scaled
+    intermediate, so the conversion allocates nothing at all.
+    """
+    scaled = np.multiply(pcm, INT16_SCALE, dtype=np.float32, out=scratch)
+    np.clip(scaled, -INT16_SCALE, INT16_SCALE - 1, out=scaled)
+    if out is None:
+        return scaled.astype(np.int16)
+    np.copyto(out, scaled, casting="unsafe")
+    return out
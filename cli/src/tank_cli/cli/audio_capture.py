@@ -3,14 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
-import queue
 from collections.abc import Awaitable, Callable
 
-import numpy as np
-
 from ..audio.input.mic import Mic
-from ..audio.input.types import AudioFormat, AudioFrame, FrameConfig
+from ..audio.input.ring import PcmRing
+from ..audio.input.types import AudioFormat, FrameConfig
 from ..core.shutdown import GracefulShutdown
 
 logger = logging.getLogger("AudioCapture")
@@ -35,33 +34,70 @@ class ClientAudioCapture:
             audio_format = AudioFormat()
         if frame_cfg is None:
             frame_cfg = FrameConfig()
-        self._frames_queue: queue.Queue[AudioFrame] = queue.Queue(maxsize=400)
+        # Mic writes int16 samples straight into one preallocated ring; the
+        # drain loop sends frame-sized views of it, so no per-frame objects.
+        self._frame_samples = frame_cfg.samples_per_frame(audio_format.sample_rate)
+        self._ring = PcmRing(frame_cfg.max_frames_queue * self._frame_samples)
+        # Set (from the Mic thread) when a frame lands, so the drain loop
+        # wakes on data instead of polling the ring.
+        self._frame_ready = asyncio.Event()
+        self._loop: asyncio.AbstractEventLoop | None = None
         self._mic = Mic(
             stop_signal=shutdown,
             audio_format=audio_format,
             frame_cfg=frame_cfg,
-            frames_queue=self._frames_queue,
+            ring=self._ring,
             device=device,
+            on_audio=self._notify_frame,
         )
 
     def start(self) -> None:
         """Start the Mic capture thread."""
         self._mic.start()
 
-    async def drain_to_ws(self, send_audio: Callable[[bytes], Awaitable[None]]) -> None:
+    async def drain_to_ws(
+        self, send_audio: Callable[[bytes | memoryview], Awaitable[None]]
+    ) -> None:
         """
-        Async loop: drain frames_queue and send as Int16 PCM bytes via WebSocket.
+        Async loop: drain the capture ring and send as Int16 PCM bytes via WebSocket.
+
+        Each frame is handed over as a memoryview into the ring rather than a
+        ``bytes`` copy; the slots are only released once ``send_audio`` has
+        returned, and the WebSocket layer copies the payload while masking it.
 
         Args:
             send_audio: async callable that sends bytes over WebSocket.
         """
-        while not self._shutdown.is_set():
-            try:
-                frame = self._frames_queue.get_nowait()
-                int16_data = (frame.pcm * 32768.0).astype(np.int16)
-                await send_audio(int16_data.tobytes())
-            except queue.Empty:
-                await asyncio.sleep(0.01)
+        self._loop = asyncio.get_running_loop()
+        # Idle waits race the next Mic frame against shutdown, so stop()
+        # wakes the loop immediately instead of on a polling tick.
+        stopped = asyncio.ensure_future(self._shutdown.wait_async())
+        try:
+            while not self._shutdown.is_set():
+                samples = self._ring.peek(self._frame_samples)
+                if samples.size == 0:
+                    self._frame_ready.clear()
+                    # Recheck after clearing so a frame written in between
+                    # is not missed
+                    if len(self._ring) == 0:
+                        frame = asyncio.ensure_future(self._frame_ready.wait())
+                        await asyncio.wait({frame, stopped}, return_when=asyncio.FIRST_COMPLETED)
+                        frame.cancel()
+                    continue
+                await send_audio(memoryview(samples).cast("B"))
+                self._ring.consume(samples.size)
+        finally:
+            stopped.cancel()
+            self._loop = None
+
+    def _notify_frame(self) -> None:
+        """Mic-thread hook: wake the drain loop. asyncio events are not
+        thread-safe, so the set is scheduled onto the loop."""
+        loop = self._loop
+        if loop is None or self._frame_ready.is_set():
+            return
+        with contextlib.suppress(RuntimeError):  # loop closed during shutdown
+            loop.call_soon_threadsafe(self._frame_ready.set)
 
     def stop(self) -> None:
         """Stop capture and wait for Mic thread."""
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import contextlib
 import logging
-import queue
 import threading
 
 from ..audio.frame import decode_audio_frame
+from ..audio.output.chunk_queue import ChunkQueue
 from ..audio.output.playback_worker import PlaybackWorker
 from ..audio.output.types import AudioChunk
 from ..core.shutdown import GracefulShutdown
@@ -24,7 +23,7 @@ class ClientAudioPlayback:
 
     def __init__(self, shutdown: GracefulShutdown):
         self._shutdown = shutdown
-        self._chunk_queue: queue.Queue[AudioChunk | None] = queue.Queue(maxsize=50)
+        self._chunk_queue = ChunkQueue(maxsize=50)
         self._interrupt_event = threading.Event()
         self._playback = PlaybackWorker(
             name="ClientPlaybackThread",
@@ -50,15 +49,15 @@ class ClientAudioPlayback:
             return
 
         chunk = AudioChunk(data=pcm, sample_rate=sample_rate, channels=channels)
-        try:
-            self._chunk_queue.put_nowait(chunk)
-        except queue.Full:
-            logger.warning("Playback queue full, dropping chunk")
+        # When full, the oldest chunk goes: after a stall the listener should
+        # hear the freshest audio, not a stale backlog.
+        if not self._chunk_queue.put_latest(chunk):
+            logger.warning("Playback queue full of end-of-stream markers, dropping chunk")
 
     def end_stream(self) -> None:
         """Signal end of current audio stream (push None marker)."""
-        with contextlib.suppress(queue.Full):
-            self._chunk_queue.put_nowait(None)
+        # Evict audio rather than lose the marker when the queue is full
+        self._chunk_queue.put_end_of_stream()
 
     def interrupt(self) -> None:
         """Interrupt current playback."""
@@ -2,16 +2,24 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import uuid
 from collections.abc import Callable
 
 import websockets
 
-from ..schemas import MessageType, WebsocketMessage
+from ..schemas import INTERRUPT_SIGNAL_JSON, MessageType, WebsocketMessage
 
 logger = logging.getLogger("TankClient")
 
+# Raw JSON "type" string -> MessageType, looked up once per incoming message.
+_MESSAGE_TYPES: dict[str, MessageType] = {t.value: t for t in MessageType}
+
+# Upper bound on the closing handshake when the user quits. websockets waits
+# 10 s by default, so an unresponsive backend would hold the terminal that long.
+_CLOSE_TIMEOUT_S = 1.5
+
 
 class TankClient:
     """
@@ -48,7 +56,7 @@ class TankClient:
         """Connect to the backend WebSocket server."""
         self._on_text_message = on_text_message
         self._on_audio_chunk = on_audio_chunk
-        self._ws = await websockets.connect(self._url)
+        self._ws = await websockets.connect(self._url, close_timeout=_CLOSE_TIMEOUT_S)
         self._running = True
         logger.info("Connected to %s", self._url)
 
@@ -64,8 +72,8 @@ class TankClient:
                     if self._on_audio_chunk:
                         self._on_audio_chunk(message)
                 elif isinstance(message, str):
-                    msg = WebsocketMessage.model_validate_json(message)
-                    if self._on_text_message:
+                    msg = self._parse_text_message(message)
+                    if msg is not None and self._on_text_message:
                         self._on_text_message(msg)
         except websockets.ConnectionClosed:
             logger.info("WebSocket connection closed")
@@ -74,22 +82,36 @@ class TankClient:
         finally:
             self._running = False
 
-    async def send_audio(self, pcm_bytes: bytes) -> None:
+    @staticmethod
+    def _parse_text_message(message: str) -> WebsocketMessage | None:
+        """Build a WebsocketMessage from server JSON without full model validation.
+
+        TEXT deltas arrive once per LLM token, so the server's (already
+        validated) payload is trusted and only ``type`` is coerced. Message
+        types this client does not know about are skipped.
+        """
+        data = json.loads(message)
+        msg_type = _MESSAGE_TYPES.get(data.get("type"))
+        if msg_type is None:
+            logger.debug("Ignoring unsupported message type: %s", data.get("type"))
+            return None
+        data["type"] = msg_type
+        return WebsocketMessage.model_construct(**data)
+
+    async def send_audio(self, pcm_bytes: bytes | memoryview) -> None:
         """Send raw PCM audio bytes to backend."""
         if self._ws and self._running:
             await self._ws.send(pcm_bytes)
 
     async def send_text_input(self, text: str) -> None:
         """Send keyboard text input."""
-        msg = WebsocketMessage(type=MessageType.INPUT, content=text)
         if self._ws and self._running:
-            await self._ws.send(msg.model_dump_json())
+            await self._ws.send(json.dumps({"type": MessageType.INPUT.value, "content": text}))
 
     async def send_interrupt(self) -> None:
         """Send interrupt signal to stop current TTS/LLM processing."""
-        msg = WebsocketMessage(type=MessageType.SIGNAL, content="interrupt")
         if self._ws and self._running:
-            await self._ws.send(msg.model_dump_json())
+            await self._ws.send(INTERRUPT_SIGNAL_JSON)
 
     async def disconnect(self) -> None:
         """Close the WebSocket connection."""
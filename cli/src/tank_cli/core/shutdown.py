@@ -1,3 +1,5 @@
+import asyncio
+import contextlib
 import threading
 from typing import Protocol
 
@@ -7,13 +9,51 @@ class StopSignal(Protocol):
 
     def is_set(self) -> bool: ...
 
+    def wait(self, timeout: float | None = None) -> bool: ...
+
 
 class GracefulShutdown:
     def __init__(self):
         self.stop_event = threading.Event()
+        # One asyncio.Event per event loop that awaits shutdown; asyncio events
+        # are not thread-safe, so stop() sets them via call_soon_threadsafe.
+        self._async_events: dict[asyncio.AbstractEventLoop, asyncio.Event] = {}
+        self._lock = threading.Lock()
 
     def stop(self):
         self.stop_event.set()
+        with self._lock:
+            waiters = list(self._async_events.items())
+            # Waiters registered from now on see stop_event and start set.
+            self._async_events.clear()
+        for loop, event in waiters:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(event.set)
 
     def is_set(self) -> bool:
         return self.stop_event.is_set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block the calling thread until stop() or timeout. Returns is_set()."""
+        return self.stop_event.wait(timeout)
+
+    async def wait_async(self, timeout: float | None = None) -> bool:
+        """Await stop() or timeout without blocking the loop. Returns is_set()."""
+        event = self._async_event()
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(event.wait(), timeout)
+        return self.is_set()
+
+    def _async_event(self) -> asyncio.Event:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            # Forget loops that have since closed so the map cannot grow
+            for stale in [lp for lp in self._async_events if lp.is_closed()]:
+                del self._async_events[stale]
+            event = self._async_events.get(loop)
+            if event is None:
+                event = asyncio.Event()
+                if self.stop_event.is_set():
+                    event.set()
+                self._async_events[loop] = event
+        return event
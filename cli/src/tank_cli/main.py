@@ -1,10 +1,20 @@
 """Tank CLI - Entry point for the TUI client."""
 
 import argparse
+import asyncio
 
 from tank_cli.config.settings import create_example_env_file
 
 
+def _install_uvloop() -> None:
+    """Run Textual's asyncio loop on uvloop when it is installed (not on Windows)."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def main():
     parser = argparse.ArgumentParser(description="Tank CLI/TUI Client")
     parser.add_argument("--server", default="localhost:8000", help="Backend server URL")
@@ -20,6 +30,7 @@ def main():
 
     from tank_cli.tui.app import TankApp
 
+    _install_uvloop()
     app = TankApp(server_url=args.server)
     app.run()
 
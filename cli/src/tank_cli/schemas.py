@@ -28,3 +28,9 @@ class WebsocketMessage(BaseModel):
     msg_id: str | None = None
     session_id: str | None = None
     metadata: dict[str, Any] = Field(default_factory=dict)
+
+
+# Control signals with fixed payloads, serialized once at import time.
+INTERRUPT_SIGNAL_JSON = WebsocketMessage(
+    type=MessageType.SIGNAL, content="interrupt"
+).model_dump_json()
@@ -3,6 +3,7 @@
 import asyncio
 import contextlib
 import logging
+from collections.abc import Callable
 
 from textual.app import App, ComposeResult
 from textual.logging import TextualHandler
@@ -23,6 +24,8 @@ logging.basicConfig(
     format="[%(levelname)s] %(name)s: %(message)s",
 )
 
+_EXIT_COMMANDS = frozenset({"quit", "exit"})
+
 
 class TankApp(App):
     CSS = """
@@ -38,6 +41,10 @@ class TankApp(App):
         self._capture = ClientAudioCapture(shutdown=self._shutdown_signal)
         self._playback = ClientAudioPlayback(shutdown=self._shutdown_signal)
         self._tasks: list[asyncio.Task] = []
+        self._signal_handlers: dict[str, Callable[[], None]] = {
+            "ready": lambda: self.notify("Connected to server"),
+            "tts_ended": self._playback.end_stream,
+        }
 
     def compose(self) -> ComposeResult:
         yield TankHeader()
@@ -60,18 +67,21 @@ class TankApp(App):
         self._tasks.append(asyncio.create_task(self._capture.drain_to_ws(self._client.send_audio)))
 
     def _handle_ws_message(self, msg: WebsocketMessage) -> None:
-        """Handle text messages from the backend WebSocket."""
+        """Handle text messages from the backend WebSocket.
+
+        Runs on the app's event loop: receive_loop is one of the app's tasks.
+        Signals dispatch through a lookup table and are never rendered.
+        """
         if msg.type == MessageType.SIGNAL:
-            if msg.content == "ready":
-                self.call_from_thread(self.notify, "Connected to server")
-            elif msg.content == "tts_ended":
-                self._playback.end_stream()
+            handler = self._signal_handlers.get(msg.content)
+            if handler is not None:
+                handler()
             return
 
-        self.call_from_thread(self._handle_ws_message, msg)
+        self._write_ws_message(msg)
 
-    def _handle_ws_message(self, msg: WebsocketMessage) -> None:
-        """Handle WebSocket message on TUI thread."""
+    def _write_ws_message(self, msg: WebsocketMessage) -> None:
+        """Render a WebSocket message in the conversation area."""
         # Check if app is still running and screen exists
         if not self.is_running or not self.screen_stack:
             return
@@ -81,7 +91,7 @@ class TankApp(App):
     def on_input_submitted(self, event: InputFooter.Submitted) -> None:
         user_input = event.value
         if user_input:
-            if user_input.lower() in ("quit", "exit"):
+            if user_input.strip().lower() in _EXIT_COMMANDS:
                 self._shutdown_signal.stop()
                 self.exit()
                 return
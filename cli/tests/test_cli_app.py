@@ -0,0 +1,45 @@
+"""Tests for TankApp's WebSocket message dispatch."""
+
+from unittest.mock import patch
+
+import pytest
+
+from tank_cli.schemas import MessageType, WebsocketMessage
+from tank_cli.tui.app import TankApp
+
+MODULE = "tank_cli.tui.app"
+
+
+@pytest.fixture
+def app():
+    with (
+        patch(f"{MODULE}.TankClient"),
+        patch(f"{MODULE}.ClientAudioCapture"),
+        patch(f"{MODULE}.ClientAudioPlayback"),
+    ):
+        app = TankApp()
+    with patch.object(app, "_write_ws_message"):
+        yield app
+
+
+def test_tts_ended_signal_ends_playback_stream_without_rendering(app):
+    app._handle_ws_message(WebsocketMessage(type=MessageType.SIGNAL, content="tts_ended"))
+
+    app._playback.end_stream.assert_called_once_with()
+    app._write_ws_message.assert_not_called()
+
+
+def test_unknown_signal_is_ignored(app):
+    app._handle_ws_message(WebsocketMessage(type=MessageType.SIGNAL, content="interrupt"))
+
+    app._playback.end_stream.assert_not_called()
+    app._write_ws_message.assert_not_called()
+
+
+def test_non_signal_message_is_rendered(app):
+    msg = WebsocketMessage(type=MessageType.TEXT, content="Hello")
+
+    app._handle_ws_message(msg)
+
+    app._write_ws_message.assert_called_once_with(msg)
+    app._playback.end_stream.assert_not_called()
@@ -1,12 +1,12 @@
 """Tests for ClientAudioCapture."""
 
 import asyncio
+import threading
 from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
 
-from tank_cli.audio.input.types import AudioFrame
 from tank_cli.cli.audio_capture import ClientAudioCapture
 from tank_cli.core.shutdown import GracefulShutdown
 
@@ -20,20 +20,19 @@ def shutdown():
 
 @pytest.mark.asyncio
 async def test_drain_to_ws_converts_float32_to_int16(shutdown):
-    """Verify float32 PCM frames are converted to int16 bytes before sending."""
+    """Verify float32 PCM frames are sent as int16 bytes."""
     with patch(f"{MODULE}.Mic") as MockMic:
         MockMic.return_value = MagicMock()
         capture = ClientAudioCapture(shutdown=shutdown)
 
-        # Push a known float32 frame into the internal queue
+        # Write a known float32 frame into the capture ring
         pcm = np.array([0.5, -0.5, 0.0, 1.0], dtype=np.float32)
-        frame = AudioFrame(pcm=pcm, sample_rate=16000, timestamp_s=1000.0)
-        capture._frames_queue.put(frame)
+        capture._ring.write(pcm)
 
         sent_data = []
 
-        async def mock_send(data: bytes):
-            sent_data.append(data)
+        async def mock_send(data: memoryview):
+            sent_data.append(bytes(data))
             # Stop after first send
             shutdown.stop()
 
@@ -41,13 +40,36 @@ async def test_drain_to_ws_converts_float32_to_int16(shutdown):
 
         assert len(sent_data) == 1
         result = np.frombuffer(sent_data[0], dtype=np.int16)
-        expected = (pcm * 32768.0).astype(np.int16)
+        # 1.0 saturates to int16 max instead of wrapping to -32768
+        expected = np.array([16384, -16384, 0, 32767], dtype=np.int16)
         np.testing.assert_array_equal(result, expected)
 
 
 @pytest.mark.asyncio
-async def test_drain_to_ws_sleeps_on_empty_queue(shutdown):
-    """When queue is empty, drain_to_ws should sleep and not crash."""
+async def test_drain_to_ws_sends_view_of_ring(shutdown):
+    """Frames are handed to the sender without copying them out of the ring."""
+    with patch(f"{MODULE}.Mic") as MockMic:
+        MockMic.return_value = MagicMock()
+        capture = ClientAudioCapture(shutdown=shutdown)
+        capture._ring.write(np.ones(capture._frame_samples, dtype=np.int16))
+
+        sent = []
+
+        async def mock_send(data: memoryview):
+            sent.append(data)
+            shutdown.stop()
+
+        await capture.drain_to_ws(mock_send)
+
+        assert isinstance(sent[0], memoryview)
+        assert sent[0].nbytes == capture._frame_samples * 2
+        assert np.shares_memory(np.frombuffer(sent[0], dtype=np.int16), capture._ring._buf)
+        assert len(capture._ring) == 0
+
+
+@pytest.mark.asyncio
+async def test_drain_to_ws_sleeps_on_empty_ring(shutdown):
+    """When the ring is empty, drain_to_ws should sleep and not crash."""
     with patch(f"{MODULE}.Mic") as MockMic:
         MockMic.return_value = MagicMock()
         capture = ClientAudioCapture(shutdown=shutdown)
@@ -67,22 +89,19 @@ async def test_drain_to_ws_sleeps_on_empty_queue(shutdown):
             stop_soon(),
         )
 
-        # Nothing was sent since queue was empty
+        # Nothing was sent since the ring was empty
         assert call_count[0] == 0
 
 
 @pytest.mark.asyncio
 async def test_drain_to_ws_sends_multiple_frames(shutdown):
-    """Multiple frames in queue should all be sent."""
+    """Frames written one after another should all be sent."""
     with patch(f"{MODULE}.Mic") as MockMic:
         MockMic.return_value = MagicMock()
         capture = ClientAudioCapture(shutdown=shutdown)
 
         for i in range(3):
-            pcm = np.array([0.1 * i], dtype=np.float32)
-            capture._frames_queue.put(
-                AudioFrame(pcm=pcm, sample_rate=16000, timestamp_s=1000.0 + i)
-            )
+            capture._ring.write(np.full(320, 0.1 * i, dtype=np.float32))
 
         sent_data = []
         send_count = [0]
@@ -97,6 +116,32 @@ async def test_drain_to_ws_sends_multiple_frames(shutdown):
         assert len(sent_data) == 3
 
 
+@pytest.mark.asyncio
+async def test_drain_to_ws_sends_frame_sized_messages(shutdown):
+    """A backlog in the ring is sent one 20 ms frame per message."""
+    with patch(f"{MODULE}.Mic") as MockMic:
+        MockMic.return_value = MagicMock()
+        capture = ClientAudioCapture(shutdown=shutdown)
+        # 400 frames of 20 ms at 16 kHz
+        assert capture._ring.capacity == 400 * 320
+
+        capture._ring.write(np.full(320, 0.25, dtype=np.float32))
+        capture._ring.write(np.full(320, -0.25, dtype=np.float32))
+
+        sent_data = []
+
+        async def mock_send(data: bytes):
+            sent_data.append(np.frombuffer(data, dtype=np.int16))
+            if len(sent_data) == 2:
+                shutdown.stop()
+
+        await capture.drain_to_ws(mock_send)
+
+        np.testing.assert_array_equal(sent_data[0], np.full(320, 8192, dtype=np.int16))
+        np.testing.assert_array_equal(sent_data[1], np.full(320, -8192, dtype=np.int16))
+        assert len(capture._ring) == 0
+
+
 def test_start_calls_mic_start(shutdown):
     """start() should delegate to Mic.start()."""
     with patch(f"{MODULE}.Mic") as MockMic:
@@ -115,3 +160,45 @@ def test_stop_calls_mic_join(shutdown):
         capture = ClientAudioCapture(shutdown=shutdown)
         capture.stop()
         mock_mic.join.assert_called_once_with(timeout=2)
+
+
+@pytest.mark.asyncio
+async def test_drain_to_ws_returns_promptly_on_stop_while_idle(shutdown):
+    """stop() from another thread wakes the idle drain loop immediately."""
+    with patch(f"{MODULE}.Mic") as MockMic:
+        MockMic.return_value = MagicMock()
+        capture = ClientAudioCapture(shutdown=shutdown)
+
+        async def mock_send(data: memoryview):
+            pass
+
+        task = asyncio.create_task(capture.drain_to_ws(mock_send))
+        await asyncio.sleep(0.02)  # drain loop is now idle-waiting
+        threading.Thread(target=shutdown.stop).start()
+        await asyncio.wait_for(task, timeout=0.5)
+        assert capture._loop is None
+
+
+@pytest.mark.asyncio
+async def test_drain_to_ws_wakes_on_mic_notification(shutdown):
+    """A frame written by the Mic thread wakes the idle drain loop."""
+    with patch(f"{MODULE}.Mic") as MockMic:
+        MockMic.return_value = MagicMock()
+        capture = ClientAudioCapture(shutdown=shutdown)
+        notify = MockMic.call_args.kwargs["on_audio"]
+        sent = asyncio.Event()
+
+        async def mock_send(data: memoryview):
+            sent.set()
+            shutdown.stop()
+
+        task = asyncio.create_task(capture.drain_to_ws(mock_send))
+        await asyncio.sleep(0.02)  # drain loop is now idle-waiting
+
+        def mic_callback():
+            capture._ring.write(np.zeros(capture._frame_samples, dtype=np.int16))
+            notify()
+
+        threading.Thread(target=mic_callback).start()
+        await asyncio.wait_for(sent.wait(), timeout=1.0)
+        await task
@@ -33,6 +33,9 @@ def test_on_audio_chunk_decodes_frame(playback):
     chunk = playback._chunk_queue.get_nowait()
     assert isinstance(chunk, AudioChunk)
     assert chunk.data == pcm
+    # Payload is a view into the received frame, not a copy
+    assert isinstance(chunk.data, memoryview)
+    assert chunk.data.obj is frame
     assert chunk.sample_rate == 22050
     assert chunk.channels == 1
 
@@ -43,19 +46,37 @@ def test_on_audio_chunk_drops_malformed_frame(playback):
     assert playback._chunk_queue.empty()
 
 
-def test_on_audio_chunk_drops_when_full(shutdown):
-    """When queue is full, on_audio_chunk should drop without raising."""
+def test_on_audio_chunk_drops_oldest_when_full(shutdown):
+    """When queue is full, on_audio_chunk should drop the oldest chunk and keep the newest."""
     with patch(f"{MODULE}.PlaybackWorker"):
         playback = ClientAudioPlayback(shutdown=shutdown)
-        frame = encode_audio_frame(b"\x00", sample_rate=24000, channels=1)
-        for _ in range(50):
-            playback.on_audio_chunk(frame)
+        for i in range(50):
+            playback.on_audio_chunk(encode_audio_frame(bytes([i]), sample_rate=24000, channels=1))
 
         # This should not raise
-        playback.on_audio_chunk(frame)
+        playback.on_audio_chunk(encode_audio_frame(b"\xff", sample_rate=24000, channels=1))
 
         # Queue size should still be 50 (maxsize)
         assert playback._chunk_queue.qsize() == 50
+        items = list(playback._chunk_queue.queue)
+        assert items[0].data == bytes([1])
+        assert items[-1].data == b"\xff"
+
+
+def test_on_audio_chunk_keeps_end_of_stream_marker_when_full(playback):
+    """Dropping the oldest chunk must never evict a queued None marker."""
+    playback.end_stream()
+    for i in range(49):
+        playback.on_audio_chunk(encode_audio_frame(bytes([i]), sample_rate=24000, channels=1))
+    assert playback._chunk_queue.full()
+
+    playback.on_audio_chunk(encode_audio_frame(b"\xff", sample_rate=24000, channels=1))
+
+    items = list(playback._chunk_queue.queue)
+    assert len(items) == 50
+    assert items[0] is None
+    assert items[1].data == bytes([1])
+    assert items[-1].data == b"\xff"
 
 
 def test_end_stream_pushes_none(playback):
@@ -66,6 +87,19 @@ def test_end_stream_pushes_none(playback):
     assert item is None
 
 
+def test_end_stream_evicts_oldest_chunk_when_full(playback):
+    """A full queue makes room for the marker instead of dropping it."""
+    for i in range(50):
+        playback.on_audio_chunk(encode_audio_frame(bytes([i]), sample_rate=24000, channels=1))
+
+    playback.end_stream()
+
+    items = list(playback._chunk_queue.queue)
+    assert len(items) == 50
+    assert items[0].data == bytes([1])
+    assert items[-1] is None
+
+
 def test_interrupt_sets_event_and_clears_queue(playback):
     """interrupt should set the event and clear pending chunks."""
     frame = encode_audio_frame(b"\x00\x01", sample_rate=24000, channels=1)
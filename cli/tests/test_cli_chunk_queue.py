@@ -0,0 +1,48 @@
+"""Tests for ChunkQueue."""
+
+from tank_cli.audio.output.chunk_queue import ChunkQueue
+from tank_cli.audio.output.types import AudioChunk
+
+
+def _chunk(i: int) -> AudioChunk:
+    return AudioChunk(data=bytes([i]), sample_rate=24000, channels=1)
+
+
+def test_put_latest_enqueues_when_room():
+    q = ChunkQueue(maxsize=2)
+    assert q.put_latest(_chunk(0))
+    assert q.get_nowait().data == bytes([0])
+
+
+def test_put_latest_evicts_oldest_chunk_but_not_markers():
+    q = ChunkQueue(maxsize=3)
+    q.put_nowait(None)
+    q.put_latest(_chunk(0))
+    q.put_latest(_chunk(1))
+
+    assert q.put_latest(_chunk(2))
+
+    items = list(q.queue)
+    assert items[0] is None
+    assert [c.data for c in items[1:]] == [bytes([1]), bytes([2])]
+
+
+def test_put_latest_drops_chunk_when_only_markers_queued():
+    q = ChunkQueue(maxsize=2)
+    q.put_nowait(None)
+    q.put_nowait(None)
+
+    assert not q.put_latest(_chunk(0))
+    assert list(q.queue) == [None, None]
+
+
+def test_put_end_of_stream_evicts_oldest_chunk_when_full():
+    q = ChunkQueue(maxsize=2)
+    q.put_latest(_chunk(0))
+    q.put_latest(_chunk(1))
+
+    assert q.put_end_of_stream()
+
+    items = list(q.queue)
+    assert items[0].data == bytes([1])
+    assert items[1] is None
@@ -54,6 +54,13 @@ async def test_connect_sets_state(client):
         assert client._ws is mock_ws
 
 
+@pytest.mark.asyncio
+async def test_connect_bounds_close_handshake(client):
+    with _mock_ws_connect(AsyncMock()) as mock_connect:
+        await client.connect(on_text_message=lambda m: None, on_audio_chunk=lambda d: None)
+    assert mock_connect.call_args.kwargs["close_timeout"] <= 2
+
+
 @pytest.mark.asyncio
 async def test_receive_loop_dispatches_text(client):
     received_messages = []
@@ -76,6 +83,32 @@ async def test_receive_loop_dispatches_text(client):
     assert received_messages[0].type == MessageType.TEXT
 
 
+@pytest.mark.asyncio
+async def test_receive_loop_skips_unknown_message_types(client):
+    received_messages = []
+
+    unknown_payload = json.dumps({"type": "channel_notification", "content": "x"})
+    text_payload = WebsocketMessage(
+        type=MessageType.UPDATE, content="tool", msg_id="m1", metadata={"k": "v"}
+    ).model_dump_json()
+
+    mock_ws = _make_async_iter_ws([unknown_payload, text_payload])
+
+    with _mock_ws_connect(mock_ws):
+        await client.connect(
+            on_text_message=received_messages.append,
+            on_audio_chunk=lambda d: None,
+        )
+        await client.receive_loop()
+
+    assert len(received_messages) == 1
+    msg = received_messages[0]
+    assert msg.type is MessageType.UPDATE
+    assert msg.msg_id == "m1"
+    assert msg.metadata == {"k": "v"}
+    assert msg.is_user is False
+
+
 @pytest.mark.asyncio
 async def test_receive_loop_dispatches_binary(client):
     received_chunks = []
@@ -129,6 +162,21 @@ async def test_send_interrupt(client):
         assert parsed["content"] == "interrupt"
 
 
+@pytest.mark.asyncio
+async def test_control_messages_sent_as_text_frames(client):
+    """Control messages must be text frames — the backend treats binary frames as audio."""
+    mock_ws = AsyncMock()
+    with _mock_ws_connect(mock_ws):
+        await client.connect(on_text_message=lambda m: None, on_audio_chunk=lambda d: None)
+        await client.send_text_input("hi")
+        await client.send_interrupt()
+        await client.send_interrupt()
+
+        sent = [call.args[0] for call in mock_ws.send.call_args_list]
+        assert all(isinstance(s, str) for s in sent)
+        assert sent[1] == sent[2]
+
+
 @pytest.mark.asyncio
 async def test_disconnect(client):
     mock_ws = AsyncMock()
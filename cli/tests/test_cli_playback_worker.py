@@ -0,0 +1,154 @@
+"""Tests for PlaybackWorker's output callback."""
+
+import queue
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from tank_cli.audio.output.playback_worker import (
+    FADE_DURATION_MS,
+    PLAYBACK_BLOCKSIZE,
+    PlaybackWorker,
+    _fade_ramp_q15,
+)
+from tank_cli.audio.output.types import AudioChunk
+from tank_cli.core.shutdown import GracefulShutdown
+
+MODULE = "tank_cli.audio.output.playback_worker"
+SAMPLE_RATE = 24000
+
+
+class _CallbackStop(Exception):
+    pass
+
+
+class _CallbackAbort(Exception):
+    pass
+
+
+class _FakeOutputStream:
+    """Drives the callback like PortAudio until it raises CallbackStop."""
+
+    # Far more blocks than any test feeds; a callback that never stops fails
+    MAX_CALLBACKS = 100
+
+    def __init__(self, *, samplerate, channels, dtype, blocksize, callback):
+        self._channels = channels
+        self._blocksize = blocksize
+        self._callback = callback
+        self.active = False
+        self.blocks: list[np.ndarray] = []
+        self.stopped_after: int | None = None
+
+    def __enter__(self):
+        for _ in range(self.MAX_CALLBACKS):
+            # Stale device memory, so any sample the callback skips shows up
+            outdata = np.full((self._blocksize, self._channels), 7, dtype=np.int16)
+            self.blocks.append(outdata)
+            try:
+                self._callback(outdata, self._blocksize, None, None)
+            except _CallbackStop:
+                self.stopped_after = len(self.blocks)
+                return self
+        pytest.fail(f"callback did not raise CallbackStop within {self.MAX_CALLBACKS} blocks")
+
+    def __exit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def opened_streams():
+    """Patch sounddevice; yields the list of streams the worker opens."""
+    streams: list[_FakeOutputStream] = []
+
+    def output_stream(**kwargs):
+        stream = _FakeOutputStream(**kwargs)
+        streams.append(stream)
+        return stream
+
+    sd = SimpleNamespace(
+        OutputStream=output_stream,
+        CallbackStop=_CallbackStop,
+        CallbackAbort=_CallbackAbort,
+        CallbackFlags=object,
+    )
+    with patch(f"{MODULE}.sd", sd):
+        yield streams
+
+
+def _chunk(samples: np.ndarray) -> AudioChunk:
+    return AudioChunk(data=samples.tobytes(), sample_rate=SAMPLE_RATE, channels=1)
+
+
+def test_callback_plays_chunks_across_blocks_with_fades(opened_streams):
+    rng = np.random.default_rng(0)
+    # Chunk sizes straddle block boundaries; the last block is partly filled
+    chunks = [rng.integers(-20000, 20000, n).astype(np.int16) for n in (100, 700, 3, 512, 900)]
+    audio_queue: queue.Queue[AudioChunk | None] = queue.Queue()
+    for samples in chunks[1:]:
+        audio_queue.put(_chunk(samples))
+    audio_queue.put(None)
+    worker = PlaybackWorker(
+        name="test", stop_signal=GracefulShutdown(), audio_chunk_queue=audio_queue
+    )
+
+    worker._play_one_stream(_chunk(chunks[0]))
+    (stream,) = opened_streams
+
+    expected = np.concatenate(chunks)
+    total = len(expected)
+    n_fade = int(SAMPLE_RATE * FADE_DURATION_MS / 1000)
+    assert total % PLAYBACK_BLOCKSIZE >= n_fade
+
+    # CallbackStop comes on the block holding the last sample, not later
+    assert stream.stopped_after == -(-total // PLAYBACK_BLOCKSIZE)
+    assert audio_queue.empty()
+
+    played = np.concatenate([block.ravel() for block in stream.blocks])
+    fade_in = (expected[:n_fade].astype(np.int32) * _fade_ramp_q15(n_fade, True)) >> 15
+    fade_out = (expected[-n_fade:].astype(np.int32) * _fade_ramp_q15(n_fade, False)) >> 15
+    np.testing.assert_array_equal(played[:n_fade], fade_in)
+    np.testing.assert_array_equal(played[n_fade : total - n_fade], expected[n_fade:-n_fade])
+    np.testing.assert_array_equal(played[total - n_fade : total], fade_out)
+    assert played[0] == 0
+    assert played[total - 1] == 0
+    assert (played[total:] == 0).all()
+
+
+def test_callback_zero_fills_underrun_until_end_of_stream(opened_streams):
+    """A late chunk is silence-padded, not stopped; None then ends the stream."""
+    first = np.full(PLAYBACK_BLOCKSIZE + 10, 1000, dtype=np.int16)
+    late = np.full(PLAYBACK_BLOCKSIZE - 56, 2000, dtype=np.int16)
+    items = iter([queue.Empty, _chunk(late), None])
+
+    class ScriptedQueue:
+        def get_nowait(self):
+            item = next(items)
+            if item is queue.Empty:
+                raise queue.Empty
+            return item
+
+    worker = PlaybackWorker(
+        name="test", stop_signal=GracefulShutdown(), audio_chunk_queue=ScriptedQueue()
+    )
+
+    worker._play_one_stream(_chunk(first))
+    (stream,) = opened_streams
+
+    blocks = [block.ravel() for block in stream.blocks]
+    assert len(blocks) == 3
+    assert stream.stopped_after == 3
+    # Underrun: the 10 leftover samples, then zeros for the rest of the block
+    assert (blocks[1][:10] == 1000).all()
+    assert (blocks[1][10:] == 0).all()
+    # The late chunk ends with the fade-out, then zeros after end-of-stream
+    n_fade = int(SAMPLE_RATE * FADE_DURATION_MS / 1000)
+    n_late = len(late)
+    assert (blocks[2][: n_late - n_fade] == 2000).all()
+    np.testing.assert_array_equal(
+        blocks[2][n_late - n_fade : n_late],
+        (late[-n_fade:].astype(np.int32) * _fade_ramp_q15(n_fade, False)) >> 15,
+    )
+    assert (blocks[2][n_late:] == 0).all()
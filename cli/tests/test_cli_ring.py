@@ -0,0 +1,66 @@
+"""Tests for PcmRing."""
+
+import numpy as np
+
+from tank_cli.audio.input.ring import PcmRing
+from tank_cli.audio.pcm import SIMD_ALIGNMENT
+
+
+def test_write_converts_float_to_int16():
+    ring = PcmRing(8)
+    assert ring.write(np.array([0.5, -0.5, 1.0], dtype=np.float32))
+    np.testing.assert_array_equal(ring.peek(8), [16384, -16384, 32767])
+
+
+def test_write_keeps_int16_and_narrows_int32():
+    ring = PcmRing(8)
+    ring.write(np.array([100, -100], dtype=np.int16))
+    ring.write(np.array([1 << 30], dtype=np.int32))
+    np.testing.assert_array_equal(ring.peek(8), [100, -100, 1 << 14])
+
+
+def test_peek_does_not_consume():
+    ring = PcmRing(8)
+    ring.write(np.arange(4, dtype=np.int16))
+    assert ring.peek(2).tolist() == [0, 1]
+    assert ring.peek(2).tolist() == [0, 1]
+    ring.consume(2)
+    assert ring.peek(8).tolist() == [2, 3]
+    assert len(ring) == 2
+
+
+def test_peek_is_a_view_of_the_ring():
+    ring = PcmRing(8)
+    ring.write(np.arange(4, dtype=np.int16))
+    view = ring.peek(4)
+    assert not view.flags.owndata
+    assert ring._buf.ctypes.data % SIMD_ALIGNMENT == 0
+
+
+def test_wraparound_is_read_in_two_views():
+    ring = PcmRing(6)
+    ring.write(np.arange(4, dtype=np.int16))
+    ring.consume(4)
+    assert ring.write(np.arange(10, 14, dtype=np.int16))
+
+    first = ring.peek(6)
+    assert first.tolist() == [10, 11]
+    ring.consume(first.size)
+    assert ring.peek(6).tolist() == [12, 13]
+
+
+def test_write_drops_whole_block_when_full():
+    ring = PcmRing(4)
+    assert ring.write(np.arange(3, dtype=np.int16))
+    assert not ring.write(np.arange(2, dtype=np.int16))
+    assert len(ring) == 3
+    assert ring.peek(4).tolist() == [0, 1, 2]
+
+
+def test_float_write_scales_through_preallocated_scratch():
+    ring = PcmRing(8)
+    scratch = ring._scratch
+    ring.write(np.array([0.25, -1.5], dtype=np.float32))
+    assert ring._scratch is scratch
+    np.testing.assert_array_equal(scratch[:2], [8192.0, -32768.0])
+    np.testing.assert_array_equal(ring.peek(8), [8192, -32768])
@@ -0,0 +1,60 @@
+"""Tests for GracefulShutdown."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from tank_cli.core.shutdown import GracefulShutdown
+
+
+def test_wait_returns_false_on_timeout():
+    shutdown = GracefulShutdown()
+    assert shutdown.wait(timeout=0.01) is False
+
+
+def test_wait_wakes_on_stop_from_other_thread():
+    shutdown = GracefulShutdown()
+    threading.Timer(0.01, shutdown.stop).start()
+
+    start = time.monotonic()
+    assert shutdown.wait(timeout=5) is True
+    assert time.monotonic() - start < 1
+
+
+@pytest.mark.asyncio
+async def test_wait_async_returns_false_on_timeout():
+    shutdown = GracefulShutdown()
+    assert await shutdown.wait_async(timeout=0.01) is False
+
+
+@pytest.mark.asyncio
+async def test_wait_async_wakes_on_stop_from_other_thread():
+    shutdown = GracefulShutdown()
+    threading.Timer(0.01, shutdown.stop).start()
+
+    assert await asyncio.wait_for(shutdown.wait_async(timeout=5), timeout=1) is True
+
+
+@pytest.mark.asyncio
+async def test_wait_async_after_stop_returns_immediately():
+    shutdown = GracefulShutdown()
+    shutdown.stop()
+
+    assert await asyncio.wait_for(shutdown.wait_async(), timeout=1) is True
+
+
+def test_wait_async_forgets_closed_loops():
+    shutdown = GracefulShutdown()
+    for _ in range(3):
+        assert asyncio.run(shutdown.wait_async(timeout=0.01)) is False
+
+    async def registered_loops():
+        await shutdown.wait_async(timeout=0.01)
+        return len(shutdown._async_events)
+
+    assert asyncio.run(registered_loops()) == 1
+
+    shutdown.stop()
+    assert shutdown._async_events == {}